@@ -0,0 +1 @@
+"""Performance benchmarks for the task scripts. Run from the scripts/ directory."""
@@ -0,0 +1,94 @@
+"""
+Measure task fingerprint throughput and how often an unchanged task is
+reported as changed.
+Every synthetic task is hashed in the form it has at each entry point: the
+task file parser (datetime dates), the CLI (date objects), CSV import
+(string priority) and the database (get_stored_task). A "false change" is
+a task whose hash differs between two of those forms. The original SHA-1
+f-string fingerprint is kept as the baseline.
+Usage (from the scripts/ directory):
+    python -m benchmarks.hash_bench --tasks 100000
+"""
+
+# pylint: disable=C0116
+import argparse
+import tempfile
+import time
+from hashlib import sha1
+from typing import Callable, List
+from benchmarks.vault_generator import inside, synthetic_tasks
+from func.model import TaskDetails, generate_task_hash, get_stored_task
+from func.task_bulk_import import bulk_insert_tasks
+from func.task_line_creator import create_task_line
+from init.db_init import init_db
+from task_parser import parse_task_line
+
+
+def legacy_generate_task_hash(task: TaskDetails) -> str:
+    """The fingerprint as it was before hash versioning, kept as the baseline."""
+    task_string = f"{task['content']}|{task['status']}|{task.get('scheduled_date', '')}|{task.get('start_date', '')}|{task.get('due_date', '')}|{task['priority']}"
+    return sha1(task_string.encode("utf-8")).hexdigest()
+
+
+def entry_point_forms(tasks: List[TaskDetails]) -> List[List[TaskDetails]]:
+    """The same tasks as the parser, the CLI, CSV import and the database produce them."""
+    parsed = [parse_task_line(create_task_line(task)) for task in tasks]
+    from_cli = [
+        TaskDetails(
+            task,
+            **{
+                key: task[key].date() if task[key] else None
+                for key in ("scheduled_date", "start_date", "due_date")
+            },
+        )
+        for task in tasks
+    ]
+    from_csv = [
+        TaskDetails(task, priority=str(task["priority"]) if task["priority"] else None)
+        for task in tasks
+    ]
+    with tempfile.TemporaryDirectory() as vault, inside(vault):
+        init_db()
+        stored = [
+            get_stored_task(task["id"])
+            for task in bulk_insert_tasks([TaskDetails(task) for task in tasks])
+        ]
+    return [list(forms) for forms in zip(tasks, parsed, from_cli, from_csv, stored)]
+
+
+def false_changes(forms: List[List[TaskDetails]], hash_task: Callable) -> int:
+    return sum(1 for variants in forms if len({hash_task(task) for task in variants}) > 1)
+
+
+def throughput(tasks: List[TaskDetails], hash_task: Callable) -> float:
+    started = time.perf_counter()
+    for task in tasks:
+        hash_task(task)
+    return len(tasks) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task fingerprint benchmark")
+    parser.add_argument("--tasks", type=int, default=100_000, help="Tasks to hash")
+    args = parser.parse_args()
+
+    tasks = synthetic_tasks(args.tasks)
+    for task_id, task in enumerate(tasks, start=1):
+        task["id"] = task_id
+    forms = entry_point_forms(tasks)
+
+    legacy = throughput(tasks, legacy_generate_task_hash)
+    current = throughput(tasks, generate_task_hash)
+    print(f"Tasks:                      {len(tasks)}")
+    print(
+        f"legacy SHA-1 fingerprint:   {legacy:12,.0f} tasks/sec  "
+        f"false changes {false_changes(forms, legacy_generate_task_hash)}"
+    )
+    print(
+        f"generate_task_hash:         {current:12,.0f} tasks/sec  "
+        f"false changes {false_changes(forms, generate_task_hash)}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Measure task-line parsing throughput in lines per second.
+Compares the compiled streaming parser in task_parser against the original
+implementation, which rebuilt its regex, printed every match and called
+strptime three times per line.
+Usage (from the scripts/ directory):
+    python -m benchmarks.parser_bench --lines 200000
+"""
+
+# pylint: disable=C0116
+import argparse
+import contextlib
+import io
+import random
+import re
+import time
+from datetime import datetime
+from typing import Callable, List, Optional
+from task_parser import parse_task_line, parse_task_lines
+
+
+def legacy_parse_task_line(line: str) -> Optional[dict]:
+    """The parser as it was before the compiled grammar, kept as the baseline."""
+    task_pattern = (
+        r"- \[([ x])\]\s+#task\s+(.*?)"  # Status and content
+        r"(?:\s+\[scheduled::\s*(\d{4}-\d{2}-\d{2})\])?"  # Scheduled date
+        r"(?:\s+\[start::\s*(\d{4}-\d{2}-\d{2})\])?"  # Start date
+        r"(?:\s+\[due::\s*(\d{4}-\d{2}-\d{2})\])?"  # Due date
+        r"(?:\s+\[priority::\s*(\d+)\])?"  # Priority
+        r"(?:\s+\[id::\s*(\d+)\])?"  # ID
+        r"\s*$"  # End of line to ensure clean matching
+    )
+
+    match = re.search(task_pattern, line)
+    print(match)  # Debugging the match object
+
+    if match:
+        scheduled_str = match.group(3)
+        start_str = match.group(4)
+        due_str = match.group(5)
+
+        try:
+            scheduled_date = (
+                datetime.strptime(scheduled_str, "%Y-%m-%d") if scheduled_str else None
+            )
+        except ValueError:
+            scheduled_date = None
+
+        try:
+            start_date = datetime.strptime(start_str, "%Y-%m-%d") if start_str else None
+        except ValueError:
+            start_date = None
+
+        try:
+            due_date = datetime.strptime(due_str, "%Y-%m-%d") if due_str else None
+        except ValueError:
+            due_date = None
+
+        return {
+            "status": "done" if match.group(1) == "x" else "undone",
+            "content": match.group(2),
+            "scheduled_date": scheduled_date,
+            "start_date": start_date,
+            "due_date": due_date,
+            "priority": int(match.group(6)) if match.group(6) else None,
+            "id": int(match.group(7)) if match.group(7) else None,
+        }
+    return None
+
+
+def make_lines(count: int, seed: int = 0) -> List[str]:
+    """Build synthetic task lines with attributes in the canonical order."""
+    rng = random.Random(seed)
+    lines = []
+    for task_id in range(1, count + 1):
+        line = f"- [{'x' if rng.random() < 0.3 else ' '}] #task Synthetic task {task_id}"
+        for key in ("scheduled", "start", "due"):
+            if rng.random() < 0.6:
+                line += f" [{key}:: 2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}]"
+        if rng.random() < 0.5:
+            line += f" [priority:: {rng.randint(1, 4)}]"
+        lines.append(f"{line} [id:: {task_id}]")
+    return lines
+
+
+def measure(parse: Callable[[List[str]], int], lines: List[str]) -> float:
+    started = time.perf_counter()
+    # The legacy parser prints every match; keep that cost but not the noise
+    with contextlib.redirect_stdout(io.StringIO()):
+        parse(lines)
+    return len(lines) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task-line parser throughput")
+    parser.add_argument("--lines", type=int, default=100_000, help="Lines to parse")
+    args = parser.parse_args()
+
+    lines = make_lines(args.lines)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        mismatches = sum(
+            1 for line in lines if legacy_parse_task_line(line) != parse_task_line(line)
+        )
+
+    legacy = measure(lambda ls: sum(1 for line in ls if legacy_parse_task_line(line)), lines)
+    single = measure(lambda ls: sum(1 for line in ls if parse_task_line(line)), lines)
+    stream = measure(lambda ls: sum(1 for _ in parse_task_lines(ls)), lines)
+
+    print(f"Lines parsed:           {len(lines)}")
+    print(f"Result mismatches:      {mismatches}")
+    print(f"legacy parse_task_line: {legacy:12,.0f} lines/sec")
+    print(f"parse_task_line:        {single:12,.0f} lines/sec ({single / legacy:.1f}x)")
+    print(f"parse_task_lines:       {stream:12,.0f} lines/sec ({stream / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
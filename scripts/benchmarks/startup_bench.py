@@ -0,0 +1,139 @@
+"""
+Measure how long cli.py takes to start and run a cheap command.
+Each command runs repeatedly in a fresh interpreter, in a small synthetic
+vault, and its median wall time above a bare 'python -c pass' is checked
+against a budget. One more run under 'python -X importtime' lists the
+slowest imports and reports modules that a command must never load
+(GitPython, process pools, ctypes). Exits with status 1 when the budget
+is exceeded or a forbidden module was imported. With --daemon, the
+commands are measured again while 'cli.py serve' is running, both as a
+client process and as the bare socket round trip.
+Usage (from the scripts/ directory):
+    python -m benchmarks.startup_bench --runs 10 --budget-ms 80 --daemon
+"""
+
+# pylint: disable=C0116
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+from benchmarks.vault_generator import generate_vault
+from cli import DAEMON_SOCKET, forward_to_daemon
+
+CLI_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cli.py")
+
+# Commands that should start in tens of milliseconds
+COMMANDS = [
+    ["add", "Startup probe", "--schedule-date", "2024-01-01"],
+    ["list", "--limit", "1"],
+    ["search", "probe", "--limit", "1"],
+    ["--help"],
+]
+
+# Heavy modules that only the commands needing them may import
+FORBIDDEN_IMPORTS = ("git", "concurrent.futures.process", "ctypes", "cProfile")
+
+
+def run_command(command: List[str]) -> float:
+    started = time.perf_counter()
+    subprocess.run(command, stdout=subprocess.DEVNULL, check=True)
+    return time.perf_counter() - started
+
+
+def import_times(command: List[str]) -> Dict[str, int]:
+    """Run one CLI command under -X importtime; cumulative microseconds per module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", CLI_PATH, *command],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            imports[name.strip()] = int(cumulative)
+    return imports
+
+
+def median_time(command: List[str], runs: int) -> float:
+    run_command(command)  # warm the bytecode cache and the page cache
+    return statistics.median(run_command(command) for _ in range(runs))
+
+
+def daemon_times(runs: int) -> None:
+    server = subprocess.Popen(
+        [sys.executable, CLI_PATH, "serve"], stdout=subprocess.DEVNULL
+    )
+    try:
+        deadline = time.monotonic() + 10
+        while not os.path.exists(DAEMON_SOCKET) and time.monotonic() < deadline:
+            time.sleep(0.05)
+        print("with 'cli.py serve' running:")
+        for command in COMMANDS[:-1]:
+            seconds = median_time([sys.executable, CLI_PATH, *command], runs)
+            round_trips = []
+            for _ in range(runs):
+                started = time.perf_counter()
+                forward_to_daemon(command)
+                round_trips.append(time.perf_counter() - started)
+            print(
+                f"{command[0]:<24} {seconds * 1000:8.1f} ms  "
+                f"(socket round trip {statistics.median(round_trips) * 1000:.1f} ms)"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="CLI startup time benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Runs per command")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=80.0,
+        help="Median time 'add' may take on top of the bare interpreter start",
+    )
+    parser.add_argument("--top", type=int, default=8, help="Slowest imports to list")
+    parser.add_argument(
+        "--daemon", action="store_true", help="Also measure with 'cli.py serve' running"
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as vault:
+        os.chdir(generate_vault(vault, 100, git=True))
+        baseline = median_time([sys.executable, "-c", "pass"], args.runs)
+        print(f"{'python -c pass':<24} {baseline * 1000:8.1f} ms")
+
+        failed = False
+        for command in COMMANDS:
+            seconds = median_time([sys.executable, CLI_PATH, *command], args.runs)
+            imports = import_times(command)
+            forbidden = sorted(name for name in imports if name in FORBIDDEN_IMPORTS)
+            overhead_ms = (seconds - baseline) * 1000
+            over_budget = command[0] == "add" and overhead_ms > args.budget_ms
+            failed = failed or bool(forbidden) or over_budget
+            print(
+                f"{command[0]:<24} {seconds * 1000:8.1f} ms  (+{overhead_ms:.1f} ms)"
+                f"{'  OVER BUDGET' if over_budget else ''}"
+            )
+            slowest = sorted(imports.items(), key=lambda item: -item[1])[: args.top]
+            for name, micros in slowest:
+                print(f"    {micros / 1000:7.1f} ms  {name}")
+            if forbidden:
+                print(f"    forbidden imports: {', '.join(forbidden)}")
+        if args.daemon:
+            daemon_times(args.runs)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Timed benchmark suite over synthetic vaults of increasing size.
+For every vault size the suite measures the hot functions of the project
+and writes machine-readable JSON, so results of two commits can be
+compared and regressions caught.
+Bulk benchmarks (parse_task_line, create_task_line, generate_task_hash)
+run over every task of the vault; per-call benchmarks (new_task_creator,
+edit_task, delete_task) run --ops calls against the full-size vault;
+find_changed_tasks runs once after editing 1% of the task files.
+Usage (from the scripts/ directory):
+    python -m benchmarks.suite --sizes 1000 10000 --output bench.json
+    python -m benchmarks.suite --compare old.json new.json
+"""
+
+# pylint: disable=C0116
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List
+from benchmarks.vault_generator import generate_vault, inside, synthetic_tasks
+from func.model import generate_task_hash, get_stored_task
+from func.task_line_creator import create_task_line
+from func.task_paths import get_task_path
+from new_task_creator import new_task_creator
+from task_delete import delete_task
+from task_manager import find_changed_tasks
+from task_modifier import edit_task
+from task_parser import parse_task_line
+from task_sync import sync_tasks
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+# Slower than this fraction is reported as a regression by --compare
+REGRESSION_THRESHOLD = 0.10
+
+
+def timed(name: str, size: int, ops: int, run: Callable[[], None]) -> Dict:
+    # The project functions print progress; measure them without the noise
+    with contextlib.redirect_stdout(io.StringIO()):
+        started = time.perf_counter()
+        run()
+        seconds = time.perf_counter() - started
+    result = {
+        "benchmark": name,
+        "size": size,
+        "ops": ops,
+        "seconds": round(seconds, 6),
+        "ops_per_sec": round(ops / seconds, 1) if seconds > 0 else None,
+    }
+    print(f"{size:>9} {name:<24} {ops:>9} ops {seconds:10.4f}s", file=sys.stderr)
+    return result
+
+
+def run_size(size: int, ops: int, seed: int) -> List[Dict]:
+    rng = random.Random(seed)
+    results = []
+
+    tasks = synthetic_tasks(size, seed)
+    for index, task in enumerate(tasks, start=1):
+        task["id"] = index
+    lines = [create_task_line(task) for task in tasks]
+
+    results.append(
+        timed("parse_task_line", size, size, lambda: [parse_task_line(line) for line in lines])
+    )
+    results.append(
+        timed("create_task_line", size, size, lambda: [create_task_line(task) for task in tasks])
+    )
+    results.append(
+        timed(
+            "generate_task_hash", size, size, lambda: [generate_task_hash(task) for task in tasks]
+        )
+    )
+    del tasks, lines
+
+    with tempfile.TemporaryDirectory() as root:
+        vault = generate_vault(root, size, seed=seed)
+        with inside(vault):
+            with contextlib.redirect_stdout(io.StringIO()):
+                sync_tasks()  # record the file states, like a first sync
+
+            new_tasks = synthetic_tasks(ops, seed + 1)
+            results.append(
+                timed(
+                    "new_task_creator",
+                    size,
+                    ops,
+                    lambda: [new_task_creator(task) for task in new_tasks],
+                )
+            )
+
+            sample = rng.sample(range(1, size + 1), min(ops, size))
+            edits = []
+            for task_id in sample:
+                task = get_stored_task(task_id)
+                task["status"] = "done" if task["status"] == "undone" else "undone"
+                edits.append(task)
+            results.append(
+                timed("edit_task", size, len(edits), lambda: [edit_task(task) for task in edits])
+            )
+
+            # Edit 1% of the files by hand, then look for the changes
+            for task_id in rng.sample(range(1, size + 1), max(1, size // 100)):
+                with open(get_task_path(task_id), "a", encoding="utf-8") as file:
+                    file.write(" [priority:: 1]")
+            results.append(
+                timed("find_changed_tasks", size, 1, lambda: find_changed_tasks())
+            )
+            results.append(
+                timed("delete_task", size, len(sample), lambda: [delete_task(task_id) for task_id in sample])
+            )
+    return results
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(old_path: str, new_path: str) -> int:
+    """Print the change of every benchmark; returns 1 if any regressed."""
+    with open(old_path, encoding="utf-8") as file:
+        old = {(r["benchmark"], r["size"]): r for r in json.load(file)["results"]}
+    with open(new_path, encoding="utf-8") as file:
+        new = {(r["benchmark"], r["size"]): r for r in json.load(file)["results"]}
+
+    regressed = False
+    for key in sorted(old.keys() & new.keys(), key=lambda k: (k[1], k[0])):
+        before = old[key]["seconds"] / old[key]["ops"]
+        after = new[key]["seconds"] / new[key]["ops"]
+        change = (after - before) / before if before else 0.0
+        flag = "REGRESSION" if change > REGRESSION_THRESHOLD else ""
+        regressed |= bool(flag)
+        print(f"{key[1]:>9} {key[0]:<24} {change:+8.1%} {flag}")
+    return 1 if regressed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task scripts benchmark suite")
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Vault sizes"
+    )
+    parser.add_argument(
+        "--ops", type=int, default=200, help="Calls per per-call benchmark"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Write the JSON results to this file")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two result files"
+    )
+    args = parser.parse_args()
+
+    if args.compare:
+        sys.exit(compare(*args.compare))
+
+    results = []
+    for size in args.sizes:
+        results.extend(run_size(size, args.ops, args.seed))
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
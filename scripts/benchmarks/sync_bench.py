@@ -0,0 +1,66 @@
+"""
+Measure how the parallel sync scan scales with the number of worker processes.
+Builds a synthetic vault in a temporary directory, rewrites every task file
+as a bulk edit would, then times scan_changes for each --jobs value and
+checks that every run finds exactly the same changes as the serial run.
+Usage (from the scripts/ directory):
+    python -m benchmarks.sync_bench --files 200000 --jobs 1 2 4 8
+"""
+
+# pylint: disable=C0116
+import argparse
+import os
+import tempfile
+import time
+from benchmarks.vault_generator import generate_vault
+from task_sync import apply_changes, scan_changes
+
+
+def bulk_edit(task_dir: str = "tasks/") -> None:
+    """Mark every task done, like a search-and-replace across tasks/."""
+    for entry in os.scandir(task_dir):
+        with open(entry.path, "r+", encoding="utf-8") as file:
+            line = file.read().replace("- [ ]", "- [x]", 1)
+            file.seek(0)
+            file.write(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Parallel sync scaling benchmark")
+    parser.add_argument("--files", type=int, default=200_000, help="Task files to generate")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+        help="Worker counts to measure",
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as vault:
+        started = time.perf_counter()
+        os.chdir(generate_vault(vault, args.files))
+        # Record the initial file states, like a first sync would
+        apply_changes(scan_changes())
+        bulk_edit()
+        print(f"Built and edited {args.files} files in {time.perf_counter() - started:.1f}s")
+
+        baseline = None
+        serial_seconds = None
+        for jobs in args.jobs:
+            started = time.perf_counter()
+            change_set = scan_changes(jobs=jobs)
+            seconds = time.perf_counter() - started
+            serial_seconds = serial_seconds or seconds
+            if baseline is None:
+                baseline = change_set["tasks"]
+            same = change_set["tasks"] == baseline
+            print(
+                f"jobs={jobs:<3} {seconds:8.2f}s  {args.files / seconds:10,.0f} files/sec  "
+                f"speedup {serial_seconds / seconds:4.1f}x  "
+                f"changed={len(change_set['tasks'])} identical={same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
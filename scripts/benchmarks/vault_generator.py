@@ -0,0 +1,125 @@
+"""
+Generate synthetic vaults for benchmarks.
+A vault is a directory with tasks/, notes/ and db/tasks.db laid out like
+'cli.py init' leaves them, filled with N tasks through the bulk importer,
+and optionally turned into a Git repository with some history.
+Usage (from the scripts/ directory):
+    python -m benchmarks.vault_generator /tmp/vault --tasks 100000 --git --history 10
+"""
+
+# pylint: disable=C0116
+import argparse
+import os
+import random
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional
+from func.create_task_file import write_task_files
+from func.model import TaskDetails
+from func.task_bulk_import import bulk_insert_tasks
+from init.db_init import init_db
+
+WORDS = (
+    "review draft plan call email report budget design meeting fix deploy "
+    "update write read test refactor invoice schedule research prepare"
+).split()
+
+
+@contextmanager
+def inside(directory: str) -> Iterator[None]:
+    """Run a block with the vault as the working directory, like the CLI does."""
+    previous = os.getcwd()
+    os.chdir(directory)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+
+def synthetic_task(index: int, rng: random.Random) -> TaskDetails:
+    base = datetime(2024, 1, 1)
+
+    def maybe_date(chance: float) -> Optional[datetime]:
+        return base + timedelta(days=rng.randint(0, 730)) if rng.random() < chance else None
+
+    words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 6)))
+    return TaskDetails(
+        status="done" if rng.random() < 0.4 else "undone",
+        content=f"{words} {index}",
+        scheduled_date=base + timedelta(days=rng.randint(0, 730)),
+        start_date=maybe_date(0.3),
+        due_date=maybe_date(0.6),
+        priority=rng.randint(1, 4) if rng.random() < 0.7 else None,
+        id=None,
+    )
+
+
+def synthetic_tasks(count: int, seed: int = 0) -> List[TaskDetails]:
+    rng = random.Random(seed)
+    return [synthetic_task(index, rng) for index in range(count)]
+
+
+def _git_history(commits: int, seed: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from git import Repo
+
+    with open(".gitignore", "w", encoding="utf-8") as file:
+        file.write("*.db-wal\n*.db-shm\n")
+    repo = Repo.init(".")
+    with repo.config_writer() as config:
+        config.set_value("user", "name", "benchmark")
+        config.set_value("user", "email", "benchmark@example.com")
+    repo.git.add("-A", ".gitignore", "tasks", "notes", "db")
+    repo.git.commit("-q", "-m", "Initial commit: synthetic vault")
+
+    rng = random.Random(seed)
+    files = sorted(os.listdir("tasks"))
+    for number in range(commits):
+        for name in rng.sample(files, min(len(files), 10)):
+            with open(os.path.join("tasks", name), "a", encoding="utf-8") as file:
+                file.write(f"\nNote added in commit {number + 1}.")
+        repo.git.commit("-q", "-a", "-m", f"Synthetic edit {number + 1}")
+
+
+def generate_vault(
+    root: str, tasks: int, git: bool = False, history: int = 0, seed: int = 0
+) -> str:
+    """
+    Build a synthetic vault.
+
+    Parameters:
+        root (str): Directory to create the vault in; created if missing.
+        tasks (int): Number of tasks (and task files) to generate.
+        git (bool): Initialise a Git repository with an initial commit.
+        history (int): Extra commits that each edit a few task files.
+        seed (int): Seed for the random task contents.
+
+    Returns:
+        str: The absolute path of the vault.
+    """
+    root = os.path.abspath(root)
+    os.makedirs(root, exist_ok=True)
+    with inside(root):
+        for directory in ("tasks", "notes", "db"):
+            os.makedirs(directory, exist_ok=True)
+        init_db()
+        write_task_files(bulk_insert_tasks(synthetic_tasks(tasks, seed), batch_size=5000))
+        if git or history:
+            _git_history(history, seed)
+    return root
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic task vault")
+    parser.add_argument("root", help="Directory to create the vault in")
+    parser.add_argument("--tasks", type=int, default=10_000, help="Number of tasks")
+    parser.add_argument("--git", action="store_true", help="Create a Git repository")
+    parser.add_argument("--history", type=int, default=0, help="Extra Git commits")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    path = generate_vault(args.root, args.tasks, args.git, args.history, args.seed)
+    print(f"Generated {args.tasks} tasks in {path}")
+
+
+if __name__ == "__main__":
+    main()
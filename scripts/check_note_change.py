@@ -1,13 +1,14 @@
 # pylint: disable = C0114
-from typing import Optional
+from typing import Iterable, List, Optional, Sequence
 from task_parser import parse_task_line
-from retrieve_task_hash import get_stored_task_hash
-from scripts.func.model import TaskDetails, generate_task_hash
+from retrieve_task_hash import get_stored_task_hash, get_stored_task_hashes
+from func.db import DB_PATH
+from func.model import TaskDetails, generate_task_hash
 
 
 def check_note_file_change(file_path: str) -> Optional[TaskDetails]:
     """
-    Check if a note has been changed in a file by comparing the SHA-1 hash
+    Check if a note has been changed in a file by comparing the fingerprint
     of the note with the hash stored in the database.
     Parameters:
         file_path (str): The path to the file containing the note.
@@ -15,7 +16,7 @@ def check_note_file_change(file_path: str) -> Optional[TaskDetails]:
         Optional[TaskDetails]: The task details if the note has been changed,
         otherwise None.
     """
-    # Get the SHA-1 hash of the note
+    # Get the fingerprint of the note
     with open(file_path, "r", encoding="utf-8") as file:
         task_line = file.readline().strip()
         task = parse_task_line(task_line)
@@ -25,3 +26,53 @@ def check_note_file_change(file_path: str) -> Optional[TaskDetails]:
     if task_hash != stored_hash:
         return task
     return None
+
+
+def find_changed_tasks_in(
+    tasks: Iterable[TaskDetails],
+    db_path: str = DB_PATH,
+    task_hashes: Optional[Sequence[str]] = None,
+) -> List[TaskDetails]:
+    """
+    Compare many parsed tasks with the database in a few batched queries.
+    Parameters:
+        tasks (Iterable[TaskDetails]): Parsed tasks; tasks without an ID are ignored.
+        db_path (str): The path to the database file.
+        task_hashes (Sequence[str], optional): Hashes already computed for
+            the tasks, in the same order.
+    Returns:
+        List[TaskDetails]: The tasks whose hash differs from the stored one.
+    """
+    tasks = list(tasks)
+    if task_hashes is None:
+        task_hashes = [generate_task_hash(task) if task else None for task in tasks]
+    pairs = [
+        (task, task_hash)
+        for task, task_hash in zip(tasks, task_hashes)
+        if task and task["id"] is not None
+    ]
+    stored_hashes = get_stored_task_hashes((task["id"] for task, _ in pairs), db_path)
+    return [
+        task for task, task_hash in pairs if task_hash != stored_hashes.get(task["id"])
+    ]
+
+
+def check_note_files_change(
+    file_paths: Iterable[str], db_path: str = DB_PATH
+) -> List[TaskDetails]:
+    """
+    Batch version of check_note_file_change: parse every file first, then
+    fetch all stored hashes at once instead of one query per file.
+    Parameters:
+        file_paths (Iterable[str]): The paths to the files containing the notes.
+        db_path (str): The path to the database file.
+    Returns:
+        List[TaskDetails]: The task details of every changed note.
+    """
+    tasks = []
+    for file_path in file_paths:
+        with open(file_path, "r", encoding="utf-8") as file:
+            task = parse_task_line(file.readline().strip())
+        if task:
+            tasks.append(task)
+    return find_changed_tasks_in(tasks, db_path)
@@ -1,8 +1,14 @@
 """
-This module defines a command-line interface (CLI) for managing tasks with three primary commands:
+This module defines a command-line interface (CLI) for managing tasks with these primary commands:
 - init: Initializes the system.
 - add: Adds a new task.
 - delete: Deletes a task by ID or by (scheduled-date AND content).
+- import: Bulk-loads tasks from a Markdown, CSV or JSONL file.
+- sync: Updates the database from task files edited by hand.
+- watch: Keeps the database in sync while task and note files are edited.
+- list: Lists tasks with filters, sort orders and page cursors.
+- search: Full-text search over task content and task file bodies.
+- serve: Runs a warm daemon that add, delete, list, search and sync are forwarded to.
 
 Command-line Usage:
 -------------------
@@ -11,29 +17,77 @@ For example:
     python cli.py add "Complete report" --schedule-date 2023-10-05
     python cli.py delete --id 5
     python cli.py delete --schedule-date 2023-10-05 --content "Complete report"
+    python cli.py import seed.csv --batch-size 5000
+    python cli.py sync
+    python cli.py watch --debounce 0.2
+    python cli.py list --status undone --sort priority --limit 20
+    python cli.py search "quarterly report"
+    python cli.py --profile sync
+    python cli.py --profile --profile-output sync.json sync
+    python cli.py serve
+
+The global --profile flag prints a per-stage timing breakdown to stderr.
+With --profile-output, a '.prof' file receives cProfile stats (open with
+pstats or snakeviz) and any other name receives a Chrome trace
+(chrome://tracing or Perfetto).
+
+While 'cli.py serve' runs in the vault, add, delete, list, search and sync
+are sent to it over db/tasks.sock and skip the cold start; without a
+daemon, or with --profile, they run in the calling process.
 """
 
-import argparse
+# Handlers import their modules when they run, so a command only pays for
+# what it uses (GitPython, process pools and ctypes are not loaded by 'add').
+# Even argparse waits until a command runs here rather than in the daemon.
+# pylint: disable=import-outside-toplevel
 import datetime
-from func.model import TaskDetails
-from new_task_creator import new_task_creator
-from task_delete import delete_task
-from init_system import init
-from reset_system import reset
+import sys
+
+# Same keys as task_list.SORT_COLUMNS and func.task_bulk_import.IMPORT_FORMATS,
+# spelled out so that building the parser imports neither module
+SORT_CHOICES = ["id", "due", "scheduled", "start", "priority"]
+IMPORT_FORMAT_CHOICES = ["md", "csv", "jsonl"]
+
+# Commands sent to a running 'cli.py serve' daemon, and where it listens
+FORWARDED_COMMANDS = ("add", "delete", "list", "search", "sync")
+DAEMON_SOCKET = "db/tasks.sock"
 
 
 def validate_date(date_str):
     """Validate and parse a date string in YYYY-MM-DD format."""
+    # fromisoformat is much cheaper to import than strptime, but it also
+    # accepts forms like '20231005', so the shape is checked first
     try:
-        return datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
+        if len(date_str) != 10 or date_str[4] != "-" or date_str[7] != "-":
+            raise ValueError(date_str)
+        return datetime.date.fromisoformat(date_str)
     except ValueError as exc:
+        import argparse
+
         raise argparse.ArgumentTypeError(
             "Invalid date format. Use YYYY-MM-DD."
         ) from exc
 
 
+def init_handler(_args):
+    """Handles the 'init' command by setting up directories, database and Git."""
+    from init_system import init
+
+    init()
+
+
+def reset_handler(_args):
+    """Handles the 'reset' command by clearing tasks and re-initializing."""
+    from reset_system import reset
+
+    reset()
+
+
 def add_task(_args):
     """Handles the 'add' command by creating and storing a new task."""
+    from func.model import TaskDetails
+    from new_task_creator import new_task_creator
+
     task = TaskDetails(
         status="undone",  # Default status is undone
         content=_args.content,
@@ -50,6 +104,8 @@ def add_task(_args):
 
 def delete_task_handler(_args):
     """Handles the 'delete' command by removing a task by ID or by (scheduled-date AND content)."""
+    from task_delete import delete_task
+
     if _args.id:
         success = delete_task(task_id=_args.id)
     elif _args.schedule_date and _args.content:
@@ -69,51 +125,325 @@ def delete_task_handler(_args):
         print("Task not found or could not be deleted.")
 
 
-# CLI setup
-parser = argparse.ArgumentParser(description="Task CLI")
-subparsers = parser.add_subparsers(dest="command")
-
-# Add 'init' command
-init_parser = subparsers.add_parser("init", help="Initialize the system")
-init_parser.set_defaults(func=init)
-
-# Add 'reset' command
-reset_parser = subparsers.add_parser("reset", help="Reset the system")
-reset_parser.set_defaults(func=lambda _args: reset())
-
-
-# Add 'add' command
-add_parser = subparsers.add_parser("add", help="Add a new task")
-add_parser.add_argument("content", type=str, help="Task description")
-add_parser.add_argument(
-    "--schedule-date",
-    type=validate_date,
-    required=True,
-    help="Scheduled date (YYYY-MM-DD)",
-)
-add_parser.add_argument(
-    "--start-date", type=validate_date, required=False, help="Start date (YYYY-MM-DD)"
-)
-add_parser.add_argument(
-    "--due-date", type=validate_date, required=False, help="Due date (YYYY-MM-DD)"
-)
-add_parser.add_argument(
-    "--priority", type=int, choices=range(1, 5), help="Priority level (1-4)"
-)
-add_parser.set_defaults(func=add_task)
-
-# Add 'delete' command
-delete_parser = subparsers.add_parser("delete", help="Delete a task")
-delete_parser.add_argument("--id", type=int, help="Task ID")
-delete_parser.add_argument(
-    "--schedule-date", type=validate_date, help="Scheduled date (YYYY-MM-DD)"
-)
-delete_parser.add_argument("--content", type=str, help="Task description")
-delete_parser.set_defaults(func=delete_task)
-
-# Parse arguments
-args = parser.parse_args()
-if args.command:
-    args.func(args)
-else:
-    parser.print_help()
+def import_tasks_handler(_args):
+    """Handles the 'import' command by bulk-loading tasks from a file."""
+    from func.task_bulk_import import import_tasks
+
+    stats = import_tasks(
+        _args.file, file_format=_args.format, batch_size=_args.batch_size
+    )
+    print(
+        f"Imported {stats['rows']} tasks ({stats['skipped']} skipped) "
+        f"in {stats['seconds']:.2f}s: {stats['rows_per_sec']:.0f} rows/sec."
+    )
+
+
+def sync_tasks_handler(_args):
+    """Handles the 'sync' command by updating tasks from changed files."""
+    from task_manager import update_changed_tasks
+
+    update_changed_tasks(use_git=_args.git, jobs=_args.jobs)
+
+
+def watch_handler(_args):
+    """Handles the 'watch' command by syncing changes until interrupted."""
+    from task_watch import watch
+
+    watch(debounce=_args.debounce, poll=_args.poll, interval=_args.interval)
+
+
+def add_filter_arguments(_parser):
+    """Add the task filter options shared by commands that select tasks."""
+    _parser.add_argument("--status", choices=["done", "undone"], help="Task status")
+    _parser.add_argument(
+        "--priority", type=int, choices=range(1, 5), help="Priority level (1-4)"
+    )
+    for name in ("due", "scheduled", "start"):
+        _parser.add_argument(
+            f"--{name}-before",
+            type=validate_date,
+            help=f"Only tasks with a {name} date before this day (YYYY-MM-DD)",
+        )
+        _parser.add_argument(
+            f"--{name}-after",
+            type=validate_date,
+            help=f"Only tasks with a {name} date on or after this day (YYYY-MM-DD)",
+        )
+
+
+def filters_from_args(_args):
+    """Collect the filter options set on the command line as a TaskFilter."""
+    from task_list import TaskFilter
+
+    keys = ["status", "priority"] + [
+        f"{name}_{bound}"
+        for name in ("due", "scheduled", "start")
+        for bound in ("before", "after")
+    ]
+    return TaskFilter(
+        **{key: getattr(_args, key) for key in keys if getattr(_args, key) is not None}
+    )
+
+
+def list_tasks_handler(_args):
+    """Handles the 'list' command by printing one page of matching tasks."""
+    from task_list import format_task_row, list_tasks, next_cursor
+
+    limit = None if _args.all else _args.limit
+    last_row = None
+    count = 0
+    for row in list_tasks(
+        filters_from_args(_args),
+        sort=_args.sort,
+        descending=_args.desc,
+        after=_args.after,
+        limit=limit,
+    ):
+        print(format_task_row(row))
+        last_row = row
+        count += 1
+
+    if last_row is not None and count == limit:
+        print(f"Next page: --after {next_cursor(last_row, _args.sort)}")
+
+
+def search_tasks_handler(_args):
+    """Handles the 'search' command by printing ranked matches with snippets."""
+    from task_search import search_tasks
+
+    results = search_tasks(_args.query, limit=_args.limit, raw=_args.raw)
+    for task_id, status, content, snippet, _score in results:
+        marker = "x" if status == "done" else " "
+        print(f"{task_id:>7}  [{marker}] {content}")
+        print(f"         {' '.join(snippet.split())}")
+    if not results:
+        print("No matching tasks.")
+
+
+def forward_to_daemon(argv, socket_path=DAEMON_SOCKET):
+    """
+    Run a command in the 'cli.py serve' daemon of this vault.
+    Returns (exit status, stdout, stderr), or None when no daemon is
+    listening. Only json and socket are imported, so the client stays light.
+    """
+    import json
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Left behind by a daemon that did not shut down cleanly
+            return None
+        client.sendall(json.dumps({"argv": argv}).encode("utf-8") + b"\n")
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+    if not line:
+        return None
+    response = json.loads(line)
+    return response["exit"], response["stdout"], response["stderr"]
+
+
+def serve_handler(_args):
+    """Handles the 'serve' command by running the daemon until interrupted."""
+    from task_daemon import serve
+
+    serve(socket_path=_args.socket)
+
+
+def run_profiled(_args):
+    """Run a command with the profiling spans enabled and report them."""
+    from func import profiling
+
+    output = _args.profile_output
+    use_cprofile = bool(output) and output.endswith(".prof")
+    profiling.enable(trace=bool(output) and not use_cprofile)
+    if use_cprofile:
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            profiler.runcall(_args.func, _args)
+        finally:
+            profiler.dump_stats(output)
+    else:
+        try:
+            _args.func(_args)
+        finally:
+            if output:
+                profiling.write_trace(output)
+    print(profiling.report(), file=sys.stderr)
+    if output:
+        print(f"Profile written to {output}.", file=sys.stderr)
+
+
+
+def build_parser() -> "argparse.ArgumentParser":
+    """Build the argument parser; building it imports no command modules."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Task CLI")
+    parser.add_argument(
+        "--profile", action="store_true", help="Print a per-stage timing breakdown to stderr"
+    )
+    parser.add_argument(
+        "--profile-output",
+        type=str,
+        metavar="FILE",
+        help="Also write cProfile stats (.prof) or a Chrome trace (.json); implies --profile",
+    )
+    subparsers = parser.add_subparsers(dest="command")
+
+    # Add 'init' command
+    init_parser = subparsers.add_parser("init", help="Initialize the system")
+    init_parser.set_defaults(func=init_handler)
+
+    # Add 'reset' command
+    reset_parser = subparsers.add_parser("reset", help="Reset the system")
+    reset_parser.set_defaults(func=reset_handler)
+
+    # Add 'add' command
+    add_parser = subparsers.add_parser("add", help="Add a new task")
+    add_parser.add_argument("content", type=str, help="Task description")
+    add_parser.add_argument(
+        "--schedule-date",
+        type=validate_date,
+        required=True,
+        help="Scheduled date (YYYY-MM-DD)",
+    )
+    add_parser.add_argument(
+        "--start-date", type=validate_date, required=False, help="Start date (YYYY-MM-DD)"
+    )
+    add_parser.add_argument(
+        "--due-date", type=validate_date, required=False, help="Due date (YYYY-MM-DD)"
+    )
+    add_parser.add_argument(
+        "--priority", type=int, choices=range(1, 5), help="Priority level (1-4)"
+    )
+    add_parser.set_defaults(func=add_task)
+
+    # Add 'delete' command
+    delete_parser = subparsers.add_parser("delete", help="Delete a task")
+    delete_parser.add_argument("--id", type=int, help="Task ID")
+    delete_parser.add_argument(
+        "--schedule-date", type=validate_date, help="Scheduled date (YYYY-MM-DD)"
+    )
+    delete_parser.add_argument("--content", type=str, help="Task description")
+    delete_parser.set_defaults(func=delete_task_handler)
+
+    # Add 'import' command
+    import_parser = subparsers.add_parser("import", help="Bulk-import tasks from a file")
+    import_parser.add_argument("file", type=str, help="Markdown, CSV or JSONL file")
+    import_parser.add_argument(
+        "--format",
+        choices=IMPORT_FORMAT_CHOICES,
+        help="File format (guessed from the extension by default)",
+    )
+    import_parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Rows per batched insert"
+    )
+    import_parser.set_defaults(func=import_tasks_handler)
+
+    # Add 'sync' command
+    sync_parser = subparsers.add_parser(
+        "sync", help="Update the database from changed task files"
+    )
+    sync_parser.add_argument(
+        "--git",
+        action="store_true",
+        help="Take candidate files from Git status instead of stat-ing tasks/",
+    )
+    sync_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for reading changed files (0 = all cores)",
+    )
+    sync_parser.set_defaults(func=sync_tasks_handler)
+
+    # Add 'watch' command
+    watch_parser = subparsers.add_parser(
+        "watch", help="Watch tasks/ and notes/ and sync changes as they happen"
+    )
+    watch_parser.add_argument(
+        "--debounce",
+        type=float,
+        default=0.2,
+        help="Seconds of quiet that end a burst of file events",
+    )
+    watch_parser.add_argument(
+        "--poll", action="store_true", help="Poll with stat instead of using inotify"
+    )
+    watch_parser.add_argument(
+        "--interval", type=float, default=2.0, help="Polling interval in seconds"
+    )
+    watch_parser.set_defaults(func=watch_handler)
+
+    # Add 'list' command
+    list_parser = subparsers.add_parser("list", help="List tasks")
+    add_filter_arguments(list_parser)
+    list_parser.add_argument(
+        "--sort", choices=SORT_CHOICES, default="id", help="Sort order"
+    )
+    list_parser.add_argument("--desc", action="store_true", help="Sort descending")
+    list_parser.add_argument("--limit", type=int, default=50, help="Tasks per page")
+    list_parser.add_argument(
+        "--after", type=str, help="Page cursor printed by the previous page"
+    )
+    list_parser.add_argument(
+        "--all", action="store_true", help="Stream every matching task without paging"
+    )
+    list_parser.set_defaults(func=list_tasks_handler)
+
+    # Add 'search' command
+    search_parser = subparsers.add_parser("search", help="Full-text search over tasks")
+    search_parser.add_argument("query", type=str, help="Words to search for")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum results")
+    search_parser.add_argument(
+        "--raw", action="store_true", help="Use FTS5 query syntax (AND, OR, NEAR, prefix*)"
+    )
+    search_parser.set_defaults(func=search_tasks_handler)
+
+    # Add 'serve' command
+    serve_parser = subparsers.add_parser(
+        "serve", help="Run a daemon that keeps the database and caches warm"
+    )
+    serve_parser.add_argument(
+        "--socket", type=str, default=DAEMON_SOCKET, help="Unix domain socket path"
+    )
+    serve_parser.set_defaults(func=serve_handler)
+    return parser
+
+
+def main(argv=None, forward=True):
+    """
+    Parse the command line and run the selected command, in the daemon
+    when one is serving this vault and forward is set.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if forward and argv and argv[0] in FORWARDED_COMMANDS:
+        import os
+
+        response = forward_to_daemon(argv) if os.path.exists(DAEMON_SOCKET) else None
+        if response is not None:
+            status, stdout, stderr = response
+            sys.stdout.write(stdout)
+            sys.stderr.write(stderr)
+            if status:
+                sys.exit(status)
+            return
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not args.command:
+        parser.print_help()
+    elif args.profile or args.profile_output:
+        run_profiled(args)
+    else:
+        args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,12 +12,16 @@ Returns:
 """
 
 # pylint: disable=missing-function-docstring
+import os
 from datetime import datetime
+from typing import Iterable
+from func.db import DB_PATH
 from func.model import TaskDetails
 from func.task_line_creator import create_task_line
+from func.task_paths import record_task_path, record_task_paths
 
 
-def create_task_file(task: TaskDetails, directory: str = "tasks/"):
+def build_task_file_path(task: TaskDetails, directory: str = "tasks/") -> str:
     date_str = (
         task["scheduled_date"].strftime("%Y")
         if task["scheduled_date"]
@@ -25,15 +29,51 @@ def create_task_file(task: TaskDetails, directory: str = "tasks/"):
     )
     task_id = task["id"]
     content = task["content"]
-    filename = f"{directory}{date_str}-{task_id}-{content}.md"
+    return f"{directory}{date_str}-{task_id}-{content}.md"
+
+
+def create_task_file(
+    task: TaskDetails, directory: str = "tasks/", db_path: str = DB_PATH
+):
+    filename = build_task_file_path(task, directory)
 
     # Create an empty file
     with open(filename, "w", encoding="utf-8") as file:
         file.write(create_task_line(task))
+    record_task_path(task["id"], filename, db_path)
 
     print(f"File '{filename}' created successfully!")
 
 
+def write_task_files(
+    tasks: Iterable[TaskDetails], directory: str = "tasks/", db_path: str = DB_PATH
+) -> int:
+    """
+    Write the Markdown files for many tasks at once.
+
+    Unlike create_task_file, this does not print a line per file, which
+    dominates the run time when thousands of files are written, and it
+    records all file paths in a single transaction.
+
+    Parameters:
+        tasks (Iterable[TaskDetails]): Tasks that already have an ID.
+        directory (str): The directory where task files are stored.
+        db_path (str): The path to the database file.
+
+    Returns:
+        int: The number of files written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for task in tasks:
+        filename = build_task_file_path(task, directory)
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(create_task_line(task))
+        paths.append((task["id"], filename))
+    record_task_paths(paths, db_path)
+    return len(paths)
+
+
 # Example usage
 if __name__ == "__main__":
     TASK = TaskDetails(
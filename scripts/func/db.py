@@ -0,0 +1,169 @@
+"""
+Shared SQLite connection layer for every database entry point.
+Connections are opened once per process, thread and database file, tuned
+for many small transactions (WAL journal, synchronous=NORMAL, a busy
+timeout and a larger prepared-statement cache) and reused until the
+process exits. Reporting queries get separate read-only connections.
+Opening a database brings its schema up to date (see func/migrations.py).
+Example:
+    with transaction() as conn:
+        conn.execute("UPDATE tasks SET status = 'done' WHERE id = ?", (1,))
+    rows = get_readonly_connection().execute("SELECT id FROM tasks").fetchall()
+"""
+
+# pylint: disable=C0116
+import atexit
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Tuple
+from func.migrations import SCHEMA_VERSION, migrate, schema_version
+
+DB_PATH = "db/tasks.db"
+BUSY_TIMEOUT_MS = 5000
+STATEMENT_CACHE_SIZE = 256
+
+# SQLite limits the number of host parameters in a single statement
+MAX_SQL_VARIABLES = 900
+
+_connections: Dict[Tuple[int, int, str, bool], sqlite3.Connection] = {}
+
+# In-process caches of database contents, keyed like the connections
+_caches: Dict[Tuple[int, int, str, bool], Dict[str, Any]] = {}
+_cache_versions: Dict[Tuple[int, int, str, bool], int] = {}
+
+
+def _connection_key(db_path: str, readonly: bool) -> Tuple[int, int, str, bool]:
+    # Keyed by PID as well, so forked workers never share the parent's handle
+    return (os.getpid(), threading.get_ident(), os.path.abspath(db_path), readonly)
+
+
+def _tune(conn: sqlite3.Connection, readonly: bool) -> sqlite3.Connection:
+    conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+    if not readonly:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+    return conn
+
+
+def get_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Return the shared read-write connection for a database file.
+
+    Parameters:
+        db_path (str): The path to the database file.
+
+    Returns:
+        sqlite3.Connection: A tuned connection reused for the whole process.
+    """
+    key = _connection_key(db_path, False)
+    conn = _connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(
+            db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        _connections[key] = _tune(conn, readonly=False)
+        migrate(conn)
+    return conn
+
+
+def get_readonly_connection(db_path: str = DB_PATH) -> sqlite3.Connection:
+    """
+    Return a shared read-only (mode=ro) connection for reporting queries.
+    It never takes the write lock, so long reads do not block writers.
+
+    Parameters:
+        db_path (str): The path to the database file.
+
+    Returns:
+        sqlite3.Connection: A read-only connection reused for the whole process.
+    """
+    key = _connection_key(db_path, True)
+    conn = _connections.get(key)
+    if conn is None:
+        # Only '%', '?' and '#' are special in the path of an SQLite URI
+        path = os.path.abspath(db_path)
+        for char, escaped in (("%", "%25"), ("?", "%3f"), ("#", "%23")):
+            path = path.replace(char, escaped)
+        uri = f"file:{path}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        if schema_version(conn) < SCHEMA_VERSION:
+            # Migrations need the write lock; run them on the read-write connection
+            get_connection(db_path)
+        _connections[key] = _tune(conn, readonly=True)
+    return conn
+
+
+@contextmanager
+def transaction(db_path: str = DB_PATH, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+    """
+    Run a block inside one transaction on the shared connection.
+    Commits on success and rolls back on error. When a transaction is
+    already open, the block joins it instead of committing early.
+
+    Parameters:
+        db_path (str): The path to the database file.
+        immediate (bool): Take the write lock at BEGIN instead of at the first write.
+
+    Returns:
+        Iterator[sqlite3.Connection]: The connection to run statements on.
+    """
+    conn = get_connection(db_path)
+    if conn.in_transaction:
+        yield conn
+        return
+
+    conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        # Caches may already hold writes that were just undone
+        _caches.pop(_connection_key(db_path, False), None)
+        raise
+    conn.commit()
+
+
+def get_cache(db_path: str = DB_PATH) -> Dict[str, Any]:
+    """
+    Return a per-database dict for keeping table contents in memory across
+    calls (used by long-running processes such as 'cli.py serve').
+    It is emptied whenever another connection has committed since the last
+    call (PRAGMA data_version) or a transaction rolled back, so what is
+    cached is never older than the database. Writers keep entries current
+    for their own commits.
+
+    Parameters:
+        db_path (str): The path to the database file.
+
+    Returns:
+        Dict[str, Any]: The cache, keyed by whatever the caller chooses.
+    """
+    key = _connection_key(db_path, False)
+    version = get_connection(db_path).execute("PRAGMA data_version").fetchone()[0]
+    if _cache_versions.get(key) != version or key not in _caches:
+        _caches[key] = {}
+        _cache_versions[key] = version
+    return _caches[key]
+
+
+def close_connections() -> None:
+    """Close every connection opened by this process."""
+    pid = os.getpid()
+    for key in [key for key in _connections if key[0] == pid]:
+        try:
+            _connections.pop(key).close()
+        except sqlite3.ProgrammingError:
+            # Connections owned by other threads can only be closed there
+            pass
+
+
+atexit.register(close_connections)
@@ -0,0 +1,250 @@
+"""
+Versioned schema migrations keyed on SQLite's PRAGMA user_version.
+Each migration runs once, in its own BEGIN IMMEDIATE transaction that also
+bumps user_version, so a failed or interrupted migration leaves the
+database at the previous version. New schema changes are appended to
+MIGRATIONS; existing entries are never edited.
+get_connection runs pending migrations when it opens a database, so old
+databases are upgraded in place on first use.
+Example:
+    applied = migrate(sqlite3.connect("db/tasks.db"))
+"""
+
+# pylint: disable=C0116
+import sqlite3
+from typing import Callable, List, Tuple
+
+# Indexes backing the filters and sort orders of 'cli.py list'. SQLite
+# appends the rowid (the task id) to every index entry; spelling it out
+# documents that (column, id) ranges drive the keyset pagination.
+LIST_INDEXES = {
+    "idx_tasks_status": "status, id",
+    "idx_tasks_due": "due_date, id",
+    "idx_tasks_scheduled": "scheduled_date, id",
+    "idx_tasks_start": "start_date, id",
+    "idx_tasks_priority": "priority, id",
+    "idx_tasks_status_due": "status, due_date, id",
+    "idx_tasks_status_scheduled": "status, scheduled_date, id",
+    "idx_tasks_status_start": "status, start_date, id",
+    "idx_tasks_status_priority": "status, priority, id",
+    "idx_tasks_priority_due": "priority, due_date, id",
+}
+
+# Keep tasks_fts.content in step with every insert, update and delete path
+FTS_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts (rowid, content, body) VALUES (new.id, new.content, '');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF content ON tasks BEGIN
+        UPDATE tasks_fts SET content = new.content WHERE rowid = new.id;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        DELETE FROM tasks_fts WHERE rowid = old.id;
+    END
+    """,
+]
+
+# julianday('0001-01-01') is 1721425.5 and date(1, 1, 1).toordinal() is 1
+JULIAN_DAY_OFFSET = 1721424.5
+
+# STRICT tables need SQLite 3.37; older libraries get the same columns without it
+STRICT = " STRICT" if sqlite3.sqlite_version_info >= (3, 37, 0) else ""
+
+
+def _create_list_indexes(conn: sqlite3.Connection) -> None:
+    for index_name, columns in LIST_INDEXES.items():
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON tasks ({columns})")
+
+
+def _baseline(conn: sqlite3.Connection) -> None:
+    """The schema init_db created before versioning; a no-op on such databases."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            start_date TEXT,
+            due_date TEXT,
+            scheduled_date TEXT,
+            created_date TEXT DEFAULT (datetime('now')),
+            modified_date TEXT DEFAULT (datetime('now')),
+            priority INTEGER DEFAULT 3,
+            status TEXT DEFAULT 'undone',
+            hash TEXT UNIQUE NOT NULL
+        )
+        """
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_tasks_dates")
+    _create_list_indexes(conn)
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_task_hash ON tasks (hash)")
+
+    # Map each task to the Markdown file that holds it
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS task_files (
+            task_id INTEGER PRIMARY KEY,
+            path TEXT NOT NULL UNIQUE
+        )
+        """
+    )
+
+    # Last seen metadata of each task file, used by the incremental sync
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS file_state (
+            path TEXT PRIMARY KEY,
+            mtime_ns INTEGER NOT NULL,
+            size INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            digest TEXT NOT NULL
+        ) WITHOUT ROWID
+        """
+    )
+
+    # Full-text index over task content and the body of each task file
+    conn.execute(
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+            content, body, tokenize = 'unicode61 remove_diacritics 2'
+        )
+        """
+    )
+    for trigger in FTS_TRIGGERS:
+        conn.execute(trigger)
+    # Index tasks stored before the full-text table existed
+    conn.execute(
+        """
+        INSERT INTO tasks_fts (rowid, content, body)
+        SELECT id, content, '' FROM tasks
+        WHERE id NOT IN (SELECT rowid FROM tasks_fts)
+        """
+    )
+
+
+def _strict_tasks(conn: sqlite3.Connection) -> None:
+    """
+    Rebuild 'tasks' as a STRICT table with dates as integer day ordinals
+    (date.toordinal()) and an INTEGER priority. The rows are converted in
+    one INSERT ... SELECT and the indexes are built once afterwards, which
+    is faster than maintaining them row by row.
+    """
+    conn.execute(
+        f"""
+        CREATE TABLE tasks_new (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            content TEXT NOT NULL,
+            start_date INTEGER,
+            due_date INTEGER,
+            scheduled_date INTEGER,
+            created_date TEXT DEFAULT (datetime('now')),
+            modified_date TEXT DEFAULT (datetime('now')),
+            priority INTEGER DEFAULT 3,
+            status TEXT DEFAULT 'undone',
+            hash TEXT UNIQUE NOT NULL
+        ){STRICT}
+        """
+    )
+    ordinal = "CAST(julianday({0}) - " + str(JULIAN_DAY_OFFSET) + " AS INTEGER)"
+    conn.execute(
+        f"""
+        INSERT INTO tasks_new (id, content, start_date, due_date, scheduled_date,
+                               created_date, modified_date, priority, status, hash)
+        SELECT id, content, {ordinal.format('start_date')}, {ordinal.format('due_date')},
+               {ordinal.format('scheduled_date')}, created_date, modified_date,
+               CAST(priority AS INTEGER), status, hash
+        FROM tasks
+        """
+    )
+    # Keep handing out IDs after the highest one ever used, not the highest left
+    last_id = conn.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'").fetchone()
+    conn.execute("DROP TABLE tasks")
+    conn.execute("ALTER TABLE tasks_new RENAME TO tasks")
+    if last_id:
+        conn.execute(
+            "UPDATE sqlite_sequence SET seq = max(seq, ?) WHERE name = 'tasks'", last_id
+        )
+
+    # The UNIQUE constraint on hash already indexes it; idx_task_hash is not rebuilt
+    _create_list_indexes(conn)
+    for trigger in FTS_TRIGGERS:
+        conn.execute(trigger)
+
+
+def _rehash_tasks(conn: sqlite3.Connection) -> None:
+    """
+    Recompute, in one UPDATE, the hash of every task stored with an older
+    fingerprint version. Tasks whose new hash collides with another task
+    (they only differed in how a date was written) keep their old one.
+    """
+    # func.model imports func.db, which imports this module
+    from func.model import HASH_VERSION, fingerprint  # pylint: disable=import-outside-toplevel
+
+    conn.create_function("task_fingerprint", 6, fingerprint, deterministic=True)
+    conn.execute(
+        """
+        UPDATE OR IGNORE tasks
+        SET hash = task_fingerprint(content, status, scheduled_date, start_date, due_date, priority),
+            hash_version = ?
+        WHERE hash_version < ?
+        """,
+        (HASH_VERSION, HASH_VERSION),
+    )
+    (stale,) = conn.execute(
+        "SELECT count(*) FROM tasks WHERE hash_version < ?", (HASH_VERSION,)
+    ).fetchone()
+    if stale:
+        print(f"{stale} tasks duplicate another task and keep their old hash.")
+
+
+def _hash_version(conn: sqlite3.Connection) -> None:
+    conn.execute("ALTER TABLE tasks ADD COLUMN hash_version INTEGER NOT NULL DEFAULT 1")
+    _rehash_tasks(conn)
+
+
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "baseline schema", _baseline),
+    (2, "STRICT tasks table with integer dates", _strict_tasks),
+    (3, "versioned blake2b task fingerprints", _hash_version),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(conn: sqlite3.Connection) -> List[int]:
+    """
+    Apply every migration newer than the database's user_version.
+
+    Parameters:
+        conn (sqlite3.Connection): A read-write connection with no open transaction.
+
+    Returns:
+        List[int]: The versions that were applied, oldest first.
+    """
+    applied: List[int] = []
+    if schema_version(conn) >= SCHEMA_VERSION:
+        return applied
+    for version, description, upgrade in MIGRATIONS:
+        if schema_version(conn) >= version:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock
+            if schema_version(conn) < version:
+                upgrade(conn)
+                conn.execute(f"PRAGMA user_version = {version}")
+                applied.append(version)
+                print(f"Migrated database schema to version {version}: {description}.")
+        except BaseException:
+            conn.rollback()
+            raise
+        conn.commit()
+    return applied
@@ -1,8 +1,8 @@
 # pylint: disable=missing-module-docstring, missing-class-docstring, missing-function-docstring
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, TypedDict
-from hashlib import sha1
-import sqlite3
+from hashlib import blake2b
+from func.db import DB_PATH, get_connection
 
 
 class TaskDetails(TypedDict):
@@ -15,24 +15,68 @@ class TaskDetails(TypedDict):
     id: Optional[int]
 
 
-def convert_date(date_obj: Optional[datetime]) -> Optional[str]:
-    return date_obj.strftime("%Y-%m-%d") if isinstance(date_obj, datetime) else date_obj
+def convert_date(date_obj: Optional[datetime]) -> Optional[int]:
+    """
+    Turn a date into the day ordinal stored in the database (date.toordinal()),
+    so date filters and sorts compare plain integers. 'YYYY-MM-DD' strings
+    are accepted as well.
+    """
+    if isinstance(date_obj, date):
+        return date_obj.toordinal()
+    if isinstance(date_obj, str) and date_obj:
+        return date.fromisoformat(date_obj[:10]).toordinal()
+    return None
 
 
-def generate_task_hash(task: TaskDetails) -> str:
+def restore_date(value: Optional[int]) -> Optional[datetime]:
+    """Inverse of convert_date: turn a stored day ordinal back into a datetime."""
+    return datetime.fromordinal(value) if value is not None else None
+
+
+# Version of the fingerprint stored next to each task hash. Version 1 was
+# the SHA-1 of an f-string of date reprs; bump this and append a rehash
+# migration (see func/migrations.py) whenever fingerprint() changes.
+HASH_VERSION = 2
+
+
+def fingerprint(
+    content: str,
+    status: str,
+    scheduled: Optional[int],
+    start: Optional[int],
+    due: Optional[int],
+    priority: Optional[int],
+) -> str:
     """
-    Generate a SHA-1 hash for the task based on its content and key fields.
+    Hash the task fields in their stored form: dates as day ordinals and
+    priority as an integer. Fields are joined with the ASCII unit separator,
+    which does not occur in task lines, so no two tasks share an encoding.
     """
-    # Concatenate the task fields into a single string for hashing
-    task_string = f"{task['content']}|{task['status']}|{task.get('scheduled_date', '')}|{task.get('start_date', '')}|{task.get('due_date', '')}|{task['priority']}"
+    canonical = "\x1f".join(
+        "" if field is None else str(field)
+        for field in (content, status, scheduled, start, due, priority)
+    )
+    return blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
 
-    # Encode and generate SHA-1 hash
-    task_hash = sha1(task_string.encode("utf-8")).hexdigest()
 
-    return task_hash
+def generate_task_hash(task: TaskDetails) -> str:
+    """
+    Generate the fingerprint of a task from its content and key fields.
+    Dates may be date, datetime or 'YYYY-MM-DD' values and priority an int
+    or a numeric string; equal tasks always get the same hash.
+    """
+    priority = task["priority"]
+    return fingerprint(
+        task["content"],
+        task["status"],
+        convert_date(task.get("scheduled_date")),
+        convert_date(task.get("start_date")),
+        convert_date(task.get("due_date")),
+        int(priority) if priority is not None and priority != "" else None,
+    )
 
 
-def get_stored_task(task_id: int, db_path: str = "db/tasks.db") -> TaskDetails:
+def get_stored_task(task_id: int, db_path: str = DB_PATH) -> TaskDetails:
     """
     Retrieve a task from the database using its ID.
 
@@ -43,23 +87,22 @@ def get_stored_task(task_id: int, db_path: str = "db/tasks.db") -> TaskDetails:
     Returns:
         TaskDetails: The task details stored in the database.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute(
-        "SELECT status, content, scheduled_date, start_date, due_date, priority, id FROM tasks WHERE id = ?",
-        (task_id,),
+    row = (
+        get_connection(db_path)
+        .execute(
+            "SELECT status, content, scheduled_date, start_date, due_date, priority, id FROM tasks WHERE id = ?",
+            (task_id,),
+        )
+        .fetchone()
     )
-    row = cursor.fetchone()
-    conn.close()
 
     if row:
         return TaskDetails(
             status=row[0],
             content=row[1],
-            scheduled_date=row[2],
-            start_date=row[3],
-            due_date=row[4],
+            scheduled_date=restore_date(row[2]),
+            start_date=restore_date(row[3]),
+            due_date=restore_date(row[4]),
             priority=row[5],
             id=row[6],
         )
@@ -0,0 +1,106 @@
+"""
+Lightweight timing spans and counters for the hot paths.
+Instrumented code wraps each stage in span("stage") and bumps counters
+with count("name"). Both are no-ops until enable() is called (the global
+--profile flag of cli.py), so the cost when profiling is off is one
+function call and a flag check.
+Example:
+    enable(trace=True)
+    with span("db.insert"):
+        insert_new_task_to_db(task)
+    print(report())
+    write_trace("trace.json")
+"""
+
+# pylint: disable=C0116
+import os
+import threading
+import time
+from contextlib import nullcontext
+from typing import Dict, List
+
+_state = {"enabled": False, "trace": False, "started": 0.0}
+_totals: Dict[str, List[float]] = {}  # name -> [seconds, calls]
+_counters: Dict[str, int] = {}
+_events: List[dict] = []
+_NULL_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "started")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc):
+        ended = time.perf_counter()
+        total = _totals.setdefault(self.name, [0.0, 0])
+        total[0] += ended - self.started
+        total[1] += 1
+        if _state["trace"]:
+            _events.append(
+                {
+                    "name": self.name,
+                    "ph": "X",
+                    "ts": (self.started - _state["started"]) * 1e6,
+                    "dur": (ended - self.started) * 1e6,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                }
+            )
+        return False
+
+
+def enable(trace: bool = False) -> None:
+    """Start collecting spans and counters; trace=True also keeps every event."""
+    _state.update(enabled=True, trace=trace, started=time.perf_counter())
+
+
+def is_enabled() -> bool:
+    return _state["enabled"]
+
+
+def span(name: str):
+    """Time a stage. Returns a shared no-op context manager when disabled."""
+    if not _state["enabled"]:
+        return _NULL_SPAN
+    return _Span(name)
+
+
+def count(name: str, amount: int = 1) -> None:
+    if _state["enabled"]:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def report() -> str:
+    """Format the per-stage breakdown, slowest stage first."""
+    if not _totals and not _counters:
+        return "No profiled stages ran."
+    lines = [f"{'stage':<28} {'calls':>8} {'total ms':>11} {'avg ms':>9}"]
+    for name, (seconds, calls) in sorted(_totals.items(), key=lambda item: -item[1][0]):
+        lines.append(
+            f"{name:<28} {calls:>8} {seconds * 1000:>11.2f} {seconds * 1000 / calls:>9.3f}"
+        )
+    if _counters:
+        lines.append("")
+        lines.extend(f"{name:<28} {value:>8}" for name, value in sorted(_counters.items()))
+    return "\n".join(lines)
+
+
+def write_trace(file_path: str) -> None:
+    """Write the collected events in Chrome trace format (chrome://tracing, Perfetto)."""
+    import json  # pylint: disable=import-outside-toplevel
+
+    with open(file_path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "traceEvents": _events,
+                "otherData": {"counters": _counters},
+            },
+            file,
+        )
@@ -0,0 +1,227 @@
+"""
+Bulk-load tasks into the 'tasks' SQLite database and the tasks/ directory.
+Tasks are read lazily from a Markdown file of task lines, a CSV file with a
+header row, or a JSON Lines file, and inserted with batched executemany
+calls inside a single transaction. The task files are written afterwards
+with a batched writer.
+Example:
+    stats = import_tasks("seed.csv")
+    print(f"{stats['rows_per_sec']:.0f} rows/sec")
+"""
+
+# pylint: disable=C0116
+import csv
+import json
+import os
+import sqlite3
+import time
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TypedDict
+from func.db import DB_PATH, MAX_SQL_VARIABLES, transaction
+from func.model import HASH_VERSION, TaskDetails, convert_date, generate_task_hash
+from func.create_task_file import write_task_files
+
+IMPORT_FORMATS = ("md", "csv", "jsonl")
+
+
+class ImportStats(TypedDict):
+    rows: int
+    skipped: int
+    files: int
+    seconds: float
+    rows_per_sec: float
+
+
+def _parse_date(value: Any) -> Optional[datetime]:
+    if value in ("", None):
+        return None
+    if isinstance(value, datetime):
+        return value
+    return datetime.strptime(str(value)[:10], "%Y-%m-%d")
+
+
+def _parse_int(value: Any) -> Optional[int]:
+    return int(value) if value not in ("", None) else None
+
+
+def record_to_task(record: Dict[str, Any]) -> TaskDetails:
+    """
+    Convert a CSV row or JSON object into a TaskDetails dictionary.
+    Missing fields default to an undone task without dates or priority.
+    """
+    return TaskDetails(
+        status=record.get("status") or "undone",
+        content=record["content"],
+        scheduled_date=_parse_date(record.get("scheduled_date")),
+        start_date=_parse_date(record.get("start_date")),
+        due_date=_parse_date(record.get("due_date")),
+        priority=_parse_int(record.get("priority")),
+        id=_parse_int(record.get("id")),
+    )
+
+
+def read_tasks(file_path: str, file_format: Optional[str] = None) -> Iterator[TaskDetails]:
+    """
+    Lazily read tasks from a Markdown, CSV or JSONL file.
+
+    Parameters:
+        file_path (str): The file to import.
+        file_format (str, optional): One of "md", "csv" or "jsonl".
+            Guessed from the file extension when omitted.
+
+    Returns:
+        Iterator[TaskDetails]: The tasks found in the file.
+    """
+    # pylint: disable=import-outside-toplevel
+    file_format = file_format or os.path.splitext(file_path)[1].lstrip(".").lower()
+    if file_format == "markdown":
+        file_format = "md"
+    if file_format not in IMPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported import format '{file_format}'. Use one of {IMPORT_FORMATS}."
+        )
+
+    with open(file_path, "r", encoding="utf-8", newline="") as file:
+        if file_format == "md":
+            from task_parser import parse_task_lines
+
+            yield from parse_task_lines(file)
+        elif file_format == "csv":
+            for row in csv.DictReader(file):
+                yield record_to_task(row)
+        else:
+            for line in file:
+                if line.strip():
+                    yield record_to_task(json.loads(line))
+
+
+def _existing_hashes(cursor: sqlite3.Cursor, hashes: List[str]) -> set:
+    found = set()
+    for start in range(0, len(hashes), MAX_SQL_VARIABLES):
+        chunk = hashes[start : start + MAX_SQL_VARIABLES]
+        placeholders = ", ".join("?" * len(chunk))
+        cursor.execute(f"SELECT hash FROM tasks WHERE hash IN ({placeholders})", chunk)
+        found.update(row[0] for row in cursor.fetchall())
+    return found
+
+
+def bulk_insert_tasks(
+    tasks: Iterable[TaskDetails],
+    db_path: str = DB_PATH,
+    batch_size: int = 1000,
+) -> List[TaskDetails]:
+    """
+    Insert many tasks in one transaction using batched executemany calls.
+
+    Tasks without an ID get the next free IDs, so the returned tasks can be
+    written to files straight away. Tasks whose hash is already stored (or
+    repeated earlier in the input) are skipped, like INSERT OR IGNORE does
+    for single inserts.
+
+    Parameters:
+        tasks (Iterable[TaskDetails]): The tasks to insert.
+        db_path (str): The path to the database file.
+        batch_size (int): Number of rows per executemany call.
+
+    Returns:
+        List[TaskDetails]: The tasks that were inserted, with their IDs set.
+    """
+    inserted: List[TaskDetails] = []
+    seen_hashes: set = set()
+
+    # Take the write lock up front so the ID range cannot be claimed twice
+    with transaction(db_path, immediate=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COALESCE(MAX(id), 0) FROM tasks")
+        next_id = cursor.fetchone()[0] + 1
+        cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'")
+        row = cursor.fetchone()
+        if row and row[0] >= next_id:
+            next_id = row[0] + 1
+
+        task_iter = iter(tasks)
+        while True:
+            batch = list(islice(task_iter, batch_size))
+            if not batch:
+                break
+
+            hashes = [generate_task_hash(task) for task in batch]
+            seen_hashes.update(_existing_hashes(cursor, hashes))
+
+            rows = []
+            for task, task_hash in zip(batch, hashes):
+                if task_hash in seen_hashes:
+                    continue
+                seen_hashes.add(task_hash)
+                if task["id"] is None:
+                    task["id"] = next_id
+                next_id = max(next_id, task["id"] + 1)
+                rows.append(
+                    (
+                        task["id"],
+                        task["content"],
+                        task["status"],
+                        convert_date(task["scheduled_date"]) if task["scheduled_date"] else None,
+                        convert_date(task["start_date"]) if task["start_date"] else None,
+                        convert_date(task["due_date"]) if task["due_date"] else None,
+                        task["priority"],
+                        task_hash,
+                        HASH_VERSION,
+                    )
+                )
+                inserted.append(task)
+
+            cursor.executemany(
+                """
+                INSERT INTO tasks (id, content, status, scheduled_date, start_date, due_date, priority, hash, hash_version, created_date, modified_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+                """,
+                rows,
+            )
+
+    return inserted
+
+
+def import_tasks(
+    file_path: str,
+    file_format: Optional[str] = None,
+    db_path: str = DB_PATH,
+    task_dir: str = "tasks/",
+    batch_size: int = 1000,
+) -> ImportStats:
+    """
+    Import tasks from a file into the database, then write their task files.
+
+    Parameters:
+        file_path (str): The Markdown, CSV or JSONL file to import.
+        file_format (str, optional): Overrides the format guessed from the extension.
+        db_path (str): The path to the database file.
+        task_dir (str): The directory where task files are stored.
+        batch_size (int): Number of rows per executemany call.
+
+    Returns:
+        ImportStats: Row, skip and file counts plus the achieved rows per second.
+    """
+    started = time.perf_counter()
+    total = 0
+
+    def counted(tasks: Iterable[TaskDetails]) -> Iterator[TaskDetails]:
+        nonlocal total
+        for task in tasks:
+            total += 1
+            yield task
+
+    inserted = bulk_insert_tasks(
+        counted(read_tasks(file_path, file_format)), db_path, batch_size
+    )
+    files = write_task_files(inserted, task_dir, db_path)
+
+    seconds = time.perf_counter() - started
+    return ImportStats(
+        rows=len(inserted),
+        skipped=total - len(inserted),
+        files=files,
+        seconds=seconds,
+        rows_per_sec=len(inserted) / seconds if seconds > 0 else 0.0,
+    )
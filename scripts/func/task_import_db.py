@@ -19,44 +19,40 @@ int: The ID of the newly inserted task record.
 """
 
 # pylint: disable=C0116
-import sqlite3
 from typing import Optional
-from func.model import TaskDetails, convert_date, generate_task_hash
+from func.db import DB_PATH, transaction
+from func.model import HASH_VERSION, TaskDetails, convert_date, generate_task_hash
 
 
 def insert_new_task_to_db(
-    task: TaskDetails, db_path: str = "db/tasks.db"
+    task: TaskDetails, db_path: str = DB_PATH
 ) -> Optional[int]:
     """
-    Insert a task into the SQLite database with SHA-1 hash for tracking changes.
+    Insert a task into the SQLite database with its fingerprint for tracking changes.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
     # Generate the hash for the task
     task_hash = generate_task_hash(task)
 
     # Insert the task into the database
-    cursor.execute(
-        """
-        INSERT OR IGNORE INTO tasks (id, content, status, scheduled_date, start_date, due_date, priority, hash, created_date, modified_date)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
-        """,
-        (
-            task["id"],
-            task["content"],
-            task["status"],
-            convert_date(task["scheduled_date"]) if task["scheduled_date"] else None,
-            convert_date(task["start_date"]) if task["start_date"] else None,
-            convert_date(task["due_date"]) if task["due_date"] else None,
-            task["priority"],
-            task_hash,  # Insert the hash here
-        ),
-    )
-    new_task_id = cursor.lastrowid
-
-    conn.commit()
-    conn.close()
+    with transaction(db_path) as conn:
+        cursor = conn.execute(
+            """
+            INSERT OR IGNORE INTO tasks (id, content, status, scheduled_date, start_date, due_date, priority, hash, hash_version, created_date, modified_date)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, datetime('now'), datetime('now'))
+            """,
+            (
+                task["id"],
+                task["content"],
+                task["status"],
+                convert_date(task["scheduled_date"]) if task["scheduled_date"] else None,
+                convert_date(task["start_date"]) if task["start_date"] else None,
+                convert_date(task["due_date"]) if task["due_date"] else None,
+                task["priority"],
+                task_hash,  # Insert the hash here
+                HASH_VERSION,
+            ),
+        )
+        new_task_id = cursor.lastrowid
 
     return new_task_id
 
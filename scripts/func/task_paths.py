@@ -0,0 +1,130 @@
+"""
+Persistent task-id to file-path index.
+Every task file written by the system is recorded in the 'task_files'
+table, so the file of a task is found with one primary-key lookup instead
+of a scan of the tasks/ directory. Long-running processes can keep the
+whole map in memory with load_task_paths.
+Example:
+    record_task_path(1, "tasks/2024-1-Write report.md")
+    get_task_path(1)  # "tasks/2024-1-Write report.md"
+"""
+
+# pylint: disable=C0116
+import os
+import re
+from typing import Iterable, Optional, Tuple
+from func.db import DB_PATH, get_cache, get_connection, transaction
+
+
+def record_task_path(task_id: int, file_path: str, db_path: str = DB_PATH) -> None:
+    """
+    Store (or move) the file path of a task.
+
+    Parameters:
+        task_id (int): The ID of the task.
+        file_path (str): The path of the task file, relative to the project root.
+        db_path (str): The path to the database file.
+    """
+    record_task_paths([(task_id, file_path)], db_path)
+
+
+def record_task_paths(
+    entries: Iterable[Tuple[int, str]], db_path: str = DB_PATH
+) -> None:
+    """
+    Store the file paths of many tasks in one transaction.
+
+    Parameters:
+        entries (Iterable[Tuple[int, str]]): (task ID, file path) pairs.
+        db_path (str): The path to the database file.
+    """
+    entries = list(entries)
+    with transaction(db_path) as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO task_files (task_id, path) VALUES (?, ?)", entries
+        )
+        paths = get_cache(db_path).get("task_paths")
+        if paths is not None:
+            paths.update(entries)
+
+
+def load_task_paths(db_path: str = DB_PATH) -> int:
+    """
+    Keep the whole id-to-path map in memory for later get_task_path calls.
+
+    Parameters:
+        db_path (str): The path to the database file.
+
+    Returns:
+        int: The number of task paths held in memory.
+    """
+    cache = get_cache(db_path)
+    if "task_paths" not in cache:
+        cache["task_paths"] = dict(
+            get_connection(db_path).execute("SELECT task_id, path FROM task_files")
+        )
+    return len(cache["task_paths"])
+
+
+def _scan_for_task_file(task_id: int, task_dir: str) -> Optional[str]:
+    # Files written before the index existed: match the exact YYYY-id- prefix
+    pattern = re.compile(rf"^\d{{4}}-{task_id}-.*\.md$")
+    if not os.path.isdir(task_dir):
+        return None
+    for filename in os.listdir(task_dir):
+        if pattern.match(filename):
+            return os.path.join(task_dir, filename)
+    return None
+
+
+def get_task_path(
+    task_id: int, db_path: str = DB_PATH, task_dir: str = "tasks/"
+) -> Optional[str]:
+    """
+    Look up the file path of a task.
+    Tasks created before the index existed are found once by scanning
+    task_dir, and recorded so later lookups are O(1).
+
+    Parameters:
+        task_id (int): The ID of the task.
+        db_path (str): The path to the database file.
+        task_dir (str): The directory where task files are stored.
+
+    Returns:
+        Optional[str]: The path of the task file, or None if it has none.
+    """
+    paths = get_cache(db_path).get("task_paths")
+    if paths is not None and task_id in paths:
+        return paths[task_id]
+    row = (
+        get_connection(db_path)
+        .execute("SELECT path FROM task_files WHERE task_id = ?", (task_id,))
+        .fetchone()
+    )
+    if row:
+        return row[0]
+
+    file_path = _scan_for_task_file(task_id, task_dir)
+    if file_path:
+        record_task_path(task_id, file_path, db_path)
+    return file_path
+
+
+def forget_task_path(task_id: int, db_path: str = DB_PATH) -> Optional[str]:
+    """
+    Remove a task from the index.
+
+    Parameters:
+        task_id (int): The ID of the task.
+        db_path (str): The path to the database file.
+
+    Returns:
+        Optional[str]: The path that was recorded for the task, if any.
+    """
+    with transaction(db_path) as conn:
+        row = conn.execute(
+            "SELECT path FROM task_files WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        conn.execute("DELETE FROM task_files WHERE task_id = ?", (task_id,))
+        get_cache(db_path).get("task_paths", {}).pop(task_id, None)
+    return row[0] if row else None
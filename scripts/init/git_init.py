@@ -19,5 +19,5 @@ def initialize_git_repo():
         print("Git repository already exists.")
 
 
-# Run setup
-initialize_git_repo()
+if __name__ == "__main__":
+    initialize_git_repo()
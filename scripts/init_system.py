@@ -27,6 +27,10 @@ __pycache__/
 *.log
 *.tmp
 *.swp
+
+# Ignore SQLite write-ahead log files
+*.db-wal
+*.db-shm
     
     """
 
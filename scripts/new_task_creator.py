@@ -1,6 +1,7 @@
 # pylint: disable = C0114
 from typing import Optional
 from func.model import TaskDetails
+from func.profiling import span
 from func.create_task_file import create_task_file
 from func.task_import_db import insert_new_task_to_db
 
@@ -17,9 +18,11 @@ def new_task_creator(task: TaskDetails) -> Optional[int]:
     # Create a Markdown file for the task
 
     # Store the task details in the database
-    new_task_id = insert_new_task_to_db(task)
+    with span("add.db_insert"):
+        new_task_id = insert_new_task_to_db(task)
     task["id"] = new_task_id
-    create_task_file(task)
+    with span("add.file_write"):
+        create_task_file(task)
     return new_task_id
 
 
@@ -1,19 +1,20 @@
 # pylint: disable=missing-module-docstring
 import sqlite3
-from typing import Optional
-from scripts.func.model import TaskDetails, generate_task_hash
+from typing import Dict, Iterable, Optional
+from func.db import DB_PATH, MAX_SQL_VARIABLES, get_connection
+from func.model import TaskDetails, generate_task_hash
 
 
-def get_stored_task_hash(task: TaskDetails, db: str = "db/tasks.db") -> Optional[str]:
+def get_stored_task_hash(task: TaskDetails, db: str = DB_PATH) -> Optional[str]:
     """
-    Retrieve the stored SHA-1 hash of a task from the database using its ID.
+    Retrieve the stored hash of a task from the database using its ID.
 
     Parameters:
         task (TaskDetails): The task dictionary containing task details, including the ID.
         db (str): Path to the SQLite database. Defaults to 'db/tasks.db'.
 
     Returns:
-        Optional[str]: The stored SHA-1 hash if found, otherwise None.
+        Optional[str]: The stored hash if found, otherwise None.
     """
     task_id = task.get("id")
     if task_id is None:
@@ -21,14 +22,11 @@ def get_stored_task_hash(task: TaskDetails, db: str = "db/tasks.db") -> Optional
 
     # Connect to the database and retrieve the stored hash
     try:
-        conn = sqlite3.connect(db)
-        cursor = conn.cursor()
-
-        # Assuming your tasks table has columns: id, hash
-        cursor.execute("SELECT hash FROM tasks WHERE id = ?", (task_id,))
-        result = cursor.fetchone()
-
-        conn.close()
+        result = (
+            get_connection(db)
+            .execute("SELECT hash FROM tasks WHERE id = ?", (task_id,))
+            .fetchone()
+        )
 
         if result:
             return result[0]  # Return the hash from the query
@@ -40,7 +38,34 @@ def get_stored_task_hash(task: TaskDetails, db: str = "db/tasks.db") -> Optional
         return None
 
 
-def is_duplicate_task(task: TaskDetails, db_path: str = "db/tasks.db") -> bool:
+def get_stored_task_hashes(
+    task_ids: Iterable[int], db: str = DB_PATH
+) -> Dict[int, str]:
+    """
+    Retrieve the stored hashes of many tasks with a few chunked IN queries.
+
+    Parameters:
+        task_ids (Iterable[int]): The IDs of the tasks.
+        db (str): Path to the SQLite database. Defaults to 'db/tasks.db'.
+
+    Returns:
+        Dict[int, str]: The stored hash of each ID found in the database.
+    """
+    ids = list(dict.fromkeys(task_ids))
+    conn = get_connection(db)
+    hashes = {}
+    for start in range(0, len(ids), MAX_SQL_VARIABLES):
+        chunk = ids[start : start + MAX_SQL_VARIABLES]
+        placeholders = ", ".join("?" * len(chunk))
+        hashes.update(
+            conn.execute(
+                f"SELECT id, hash FROM tasks WHERE id IN ({placeholders})", chunk
+            ).fetchall()
+        )
+    return hashes
+
+
+def is_duplicate_task(task: TaskDetails, db_path: str = DB_PATH) -> bool:
     """
     Check if a task already exists in the database by comparing its hash.
 
@@ -53,12 +78,10 @@ def is_duplicate_task(task: TaskDetails, db_path: str = "db/tasks.db") -> bool:
     """
     task_hash = generate_task_hash(task)
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
-    cursor.execute("SELECT COUNT(*) FROM tasks WHERE task_hash = ?", (task_hash,))
-    result = cursor.fetchone()
-
-    conn.close()
+    result = (
+        get_connection(db_path)
+        .execute("SELECT COUNT(*) FROM tasks WHERE hash = ?", (task_hash,))
+        .fetchone()
+    )
 
     return result[0] > 0
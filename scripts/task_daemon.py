@@ -0,0 +1,116 @@
+"""
+Local daemon that runs CLI commands in a warm process.
+'cli.py serve' listens on a Unix domain socket in the vault (db/tasks.sock)
+and keeps the imported modules, the SQLite connection, the id-to-path map
+and the file states of the last sync in memory. When the socket exists,
+'cli.py' forwards the commands in cli.FORWARDED_COMMANDS to it instead of
+starting cold (see cli.forward_to_daemon), and falls back to running them
+itself when no daemon answers.
+
+The protocol is one JSON object per line in each direction:
+    request:  {"argv": ["add", "Write report", "--schedule-date", "2024-01-05"]}
+    response: {"exit": 0, "stdout": "...", "stderr": "..."}
+Requests are handled one at a time, in the order they arrive.
+Example:
+    serve()                                           # in one terminal
+    forward_to_daemon(["list", "--limit", "5"])       # from another process
+"""
+
+# pylint: disable=C0116
+import contextlib
+import io
+import json
+import os
+import signal
+import socket
+import sys
+from typing import List, Tuple
+from cli import DAEMON_SOCKET, FORWARDED_COMMANDS, main
+from func.db import DB_PATH
+from func.task_paths import load_task_paths
+from task_sync import load_file_states
+
+
+def _run(argv: List[str]) -> Tuple[int, str, str]:
+    stdout, stderr = io.StringIO(), io.StringIO()
+    status = 0
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            if not argv or argv[0] not in FORWARDED_COMMANDS:
+                raise ValueError(f"Command not served by the daemon: {' '.join(argv)}")
+            main(argv, forward=False)
+        except SystemExit as exc:
+            # argparse errors and --help
+            status = exc.code if isinstance(exc.code, int) else 1
+        except Exception as exc:  # pylint: disable=broad-except
+            print(f"Error: {exc}", file=sys.stderr)
+            status = 1
+    return status, stdout.getvalue(), stderr.getvalue()
+
+
+def _handle(connection: socket.socket) -> None:
+    with connection.makefile("rb") as stream:
+        line = stream.readline()
+    if not line:
+        return
+    try:
+        argv = json.loads(line)["argv"]
+    except (ValueError, KeyError, TypeError):
+        status, stdout, stderr = 1, "", "Error: malformed request\n"
+    else:
+        status, stdout, stderr = _run(argv)
+    response = {"exit": status, "stdout": stdout, "stderr": stderr}
+    # Unbuffered, so nothing is left to flush if SIGTERM arrives mid-write
+    connection.sendall(json.dumps(response).encode("utf-8") + b"\n")
+
+
+def _is_listening(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+def serve(socket_path: str = DAEMON_SOCKET, db_path: str = DB_PATH) -> None:
+    """
+    Serve forwarded CLI commands until interrupted.
+
+    Parameters:
+        socket_path (str): Where to create the Unix domain socket.
+        db_path (str): The database to keep warm.
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix domain sockets are not available on this platform.")
+        return
+    if os.path.exists(socket_path):
+        if _is_listening(socket_path):
+            print(f"A daemon is already listening on {socket_path}.")
+            return
+        os.remove(socket_path)
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    server.listen(16)
+    print(f"Serving on {socket_path}. Press Ctrl+C to stop.")
+    # Let 'kill' remove the socket too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        while True:
+            # Reload whatever another process invalidated since the last request
+            load_task_paths(db_path)
+            load_file_states(db_path)
+            connection, _ = server.accept()
+            with connection:
+                try:
+                    _handle(connection)
+                except OSError:
+                    pass  # the client went away
+    except KeyboardInterrupt:
+        print("Stopped serving.")
+    finally:
+        server.close()
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
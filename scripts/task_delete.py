@@ -18,16 +18,19 @@ Example:
     delete_task_from_db(content="Task content", scheduled_date="2023-10-01")
 """
 
-import sqlite3
 import os
 from typing import Optional
+from func.db import DB_PATH, transaction
+from func.model import convert_date
+from func.profiling import span
+from func.task_paths import forget_task_path, get_task_path
 
 
 def delete_task(
     task_id: Optional[int] = None,
     content: Optional[str] = None,
     scheduled_date: Optional[str] = None,
-    db_path="db/tasks.db",
+    db_path=DB_PATH,
 ) -> bool:
     """
     Delete a task from the database and its corresponding file.
@@ -41,49 +44,46 @@ def delete_task(
     Returns:
         bool: True if the task was deleted successfully, False otherwise.
     """
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
+    with span("delete.db"), transaction(db_path) as conn:
+        cursor = conn.cursor()
 
-    if task_id:
-        # Delete by ID
-        cursor.execute(
-            "SELECT content, scheduled_date FROM tasks WHERE id = ?", (task_id,)
-        )
-        task = cursor.fetchone()
-        if task:
-            file_path = f"tasks/{task[1][:4]}-{task_id}-{task[0]}.md"
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            # delete_file(file_path)
-        else:
-            print("Task ID not found.")
-            conn.close()
-            return False
+        if task_id:
+            # Delete by ID
+            cursor.execute("SELECT id FROM tasks WHERE id = ?", (task_id,))
+            task = cursor.fetchone()
+            if task:
+                with span("delete.path_lookup"):
+                    file_path = get_task_path(task_id, db_path)
+                    forget_task_path(task_id, db_path)
+                cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                # delete_file(file_path)
+            else:
+                print("Task ID not found.")
+                return False
+
+        elif content and scheduled_date:
+            # Retrieve ID first, then delete
+            cursor.execute(
+                "SELECT id FROM tasks WHERE content = ? AND scheduled_date = ?",
+                (content, convert_date(scheduled_date)),
+            )
+            task = cursor.fetchone()
+            if task:
+                task_id = task[0]
+                with span("delete.path_lookup"):
+                    file_path = get_task_path(task_id, db_path)
+                    forget_task_path(task_id, db_path)
+                print(file_path)
+                cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                # delete_file(file_path)
+            else:
+                print("Task with given content and date not found.")
+                return False
 
-    elif content and scheduled_date:
-        # Retrieve ID first, then delete
-        cursor.execute(
-            "SELECT id FROM tasks WHERE content = ? AND scheduled_date = ?",
-            (content, scheduled_date),
-        )
-        task = cursor.fetchone()
-        if task:
-            task_id = task[0]
-            file_path = f"tasks/{scheduled_date[:4]}-{task_id}-{content}.md"
-            print(file_path)
-            cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            # delete_file(file_path)
         else:
-            print("Task with given content and date not found.")
-            conn.close()
+            print("Provide either a task ID or both content and scheduled date.")
             return False
 
-    else:
-        print("Provide either a task ID or both content and scheduled date.")
-        conn.close()
-        return False
-
-    conn.commit()
-    conn.close()
     print("Task deleted successfully.")
     return True
 
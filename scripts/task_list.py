@@ -0,0 +1,179 @@
+"""
+List tasks from the database with filters, sort orders and keyset pagination.
+Every filter/sort combination is served by an index created in init_db
+(see LIST_INDEXES in func/migrations.py), and
+pages continue from the last (sort value, id) pair seen instead of using
+OFFSET, so page 500 costs the same as page 1. Rows are streamed with
+fetchmany from a read-only connection.
+Example:
+    for row in list_tasks({"status": "undone"}, sort="priority", limit=20):
+        print(row)
+"""
+
+# pylint: disable=C0116
+import base64
+import json
+from datetime import date
+from typing import Any, Iterator, List, Optional, Tuple, TypedDict
+from func.db import DB_PATH, get_readonly_connection
+from func.model import convert_date
+
+SORT_COLUMNS = {
+    "id": "id",
+    "due": "due_date",
+    "scheduled": "scheduled_date",
+    "start": "start_date",
+    "priority": "priority",
+}
+
+LIST_COLUMNS = "id, status, priority, scheduled_date, start_date, due_date, content"
+FETCH_SIZE = 256
+
+
+class TaskFilter(TypedDict, total=False):
+    status: str
+    priority: int
+    due_before: Any
+    due_after: Any
+    scheduled_before: Any
+    scheduled_after: Any
+    start_before: Any
+    start_after: Any
+
+
+def build_filter(filters: TaskFilter) -> Tuple[List[str], List[Any]]:
+    """
+    Turn a TaskFilter into SQL conditions and their parameters.
+    Date bounds are inclusive on 'after' and exclusive on 'before'.
+    """
+    conditions: List[str] = []
+    params: List[Any] = []
+    if filters.get("status"):
+        conditions.append("status = ?")
+        params.append(filters["status"])
+    if filters.get("priority") is not None:
+        conditions.append("priority = ?")
+        params.append(filters["priority"])
+    for prefix in ("due", "scheduled", "start"):
+        column = f"{prefix}_date"
+        if filters.get(f"{prefix}_after"):
+            conditions.append(f"{column} >= ?")
+            params.append(convert_date(filters[f"{prefix}_after"]))
+        if filters.get(f"{prefix}_before"):
+            conditions.append(f"{column} < ?")
+            params.append(convert_date(filters[f"{prefix}_before"]))
+    return conditions, params
+
+
+def encode_cursor(sort_value: Any, task_id: int) -> str:
+    payload = json.dumps([sort_value, task_id]).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        sort_value, task_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+    except (ValueError, TypeError) as exc:
+        raise ValueError(f"Invalid page cursor: {cursor}") from exc
+    return sort_value, task_id
+
+
+def _segments(
+    column: str, descending: bool, after: Optional[Tuple[Any, int]]
+) -> List[Tuple[str, List[Any]]]:
+    """
+    Split the keyset into index ranges. NULLs sort first ascending and last
+    descending; each range is queried on its own so the cursor always
+    becomes an index seek rather than a scan from the start.
+    """
+    op = "<" if descending else ">"
+    if column == "id":
+        return [(f"id {op} ?", [after[1]])] if after else [("1", [])]
+
+    null_part = (f"{column} IS NULL", [])
+    value_part = (f"{column} IS NOT NULL", [])
+    if after:
+        sort_value, task_id = after
+        if sort_value is None:
+            null_part = (f"{column} IS NULL AND id {op} ?", [task_id])
+            # Ascending, the non-null values all come after the NULLs
+            return [null_part] if descending else [null_part, value_part]
+        value_part = (f"({column}, id) {op} (?, ?)", [sort_value, task_id])
+        return [value_part, null_part] if descending else [value_part]
+    return [value_part, null_part] if descending else [null_part, value_part]
+
+
+def list_tasks(
+    filters: Optional[TaskFilter] = None,
+    sort: str = "id",
+    descending: bool = False,
+    after: Optional[str] = None,
+    limit: Optional[int] = 50,
+    db_path: str = DB_PATH,
+) -> Iterator[tuple]:
+    """
+    Stream tasks matching the filters in the requested order.
+
+    Parameters:
+        filters (TaskFilter, optional): Status, priority and date-range filters.
+        sort (str): One of SORT_COLUMNS.
+        descending (bool): Sort from the highest value down.
+        after (str, optional): Cursor returned by next_cursor for the previous page.
+        limit (int, optional): Maximum rows to return; None streams everything.
+        db_path (str): The path to the database file.
+
+    Returns:
+        Iterator[tuple]: (id, status, priority, scheduled_date, start_date,
+        due_date, content) rows.
+    """
+    if sort not in SORT_COLUMNS:
+        raise ValueError(f"Unknown sort order '{sort}'. Use one of {list(SORT_COLUMNS)}.")
+    column = SORT_COLUMNS[sort]
+    direction = "DESC" if descending else "ASC"
+    order_by = f"id {direction}" if column == "id" else f"{column} {direction}, id {direction}"
+    conditions, params = build_filter(filters or TaskFilter())
+    conn = get_readonly_connection(db_path)
+
+    remaining = limit
+    for segment, segment_params in _segments(
+        column, descending, decode_cursor(after) if after else None
+    ):
+        if remaining is not None and remaining <= 0:
+            return
+        where = " AND ".join(conditions + [segment])
+        sql = f"SELECT {LIST_COLUMNS} FROM tasks WHERE {where} ORDER BY {order_by}"
+        if remaining is not None:
+            sql += f" LIMIT {int(remaining)}"
+        cursor = conn.execute(sql, params + segment_params)
+        while True:
+            rows = cursor.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            for row in rows:
+                yield row
+            if remaining is not None:
+                remaining -= len(rows)
+
+
+def next_cursor(row: tuple, sort: str = "id") -> str:
+    """Build the cursor that continues a listing after the given row."""
+    position = LIST_COLUMNS.split(", ").index(SORT_COLUMNS[sort])
+    return encode_cursor(row[position], row[0])
+
+
+def format_task_row(row: tuple) -> str:
+    task_id, status, priority, scheduled, start, due, content = row
+    marker = "x" if status == "done" else " "
+    # Dates are stored as day ordinals
+    details = [
+        f"{label}:: {date.fromordinal(value).isoformat() if label != 'priority' else value}"
+        for label, value in (
+            ("scheduled", scheduled),
+            ("start", start),
+            ("due", due),
+            ("priority", priority),
+        )
+        if value is not None
+    ]
+    suffix = "".join(f" [{detail}]" for detail in details)
+    return f"{task_id:>7}  [{marker}] {content}{suffix}"
@@ -1,27 +1,24 @@
 from typing import List
-from git_file_change import get_repo_file_changes
-from check_note_change import check_note_file_change
 from task_parser import TaskDetails
-from task_update_db import update_task_to_db
+from task_sync import SyncStats, apply_changes, scan_changes
 
 
-def find_changed_tasks() -> List[TaskDetails]:
+def find_changed_tasks(use_git: bool = False) -> List[TaskDetails]:
     """
-    Find all tasks that have been changed in the repository."""
-    changed_files = get_repo_file_changes()["changed"]
-    changed_tasks = []
-    for file_path in changed_files:
-        if file_path.startswith("tasks/"):
-            changes = check_note_file_change(file_path)
-            if changes:
-                changed_tasks.append(changes)
-    return changed_tasks
+    Find all tasks that have been changed in the repository.
+    Only files whose stat metadata changed since the last sync are read;
+    pass use_git=True to take the candidate files from Git status instead."""
+    return scan_changes(use_git=use_git)["tasks"]
 
 
-def update_changed_tasks():
+def update_changed_tasks(use_git: bool = False, jobs: int = 1) -> SyncStats:
     """
-    Update all tasks that have been changed in the repository compare to last commit."""
-    changed_tasks = find_changed_tasks()
-    for task in changed_tasks:
-        update_task_to_db(task)
-    print(f"Updated {len(changed_tasks)} tasks.")
+    Update all tasks that have been changed in the repository since the last sync.
+    With jobs > 1 the changed files are read and parsed by a process pool."""
+    stats = apply_changes(scan_changes(use_git=use_git, jobs=jobs))
+    print(
+        f"Scanned {stats['scanned']} files: {stats['skipped']} skipped, "
+        f"{stats['reparsed']} reparsed, {stats['removed']} removed."
+    )
+    print(f"Updated {stats['updated']} tasks.")
+    return stats
@@ -1,7 +1,10 @@
 import os
-from scripts.func.model import TaskDetails, get_stored_task
+from func.create_task_file import build_task_file_path
+from func.model import TaskDetails, get_stored_task
+from func.profiling import span
+from func.task_line_creator import create_task_line
+from func.task_paths import get_task_path, record_task_path
 from task_update_db import update_task_to_db
-from scripts.func.task_line_creator import create_task_line
 
 
 def edit_task(
@@ -18,7 +21,8 @@ def edit_task(
         task_dir (str): The directory where task files are stored.
     """
     # Retrieve existing task from the database
-    existing_task = get_stored_task(task["id"], db_path)
+    with span("edit.db_read"):
+        existing_task = get_stored_task(task["id"], db_path)
     if not existing_task:
         print("Task not found in the database.")
         return
@@ -34,10 +38,12 @@ def edit_task(
         return
 
     # Update database with new values
-    update_task_to_db(task, db_path)
+    with span("edit.db_update"):
+        update_task_to_db(task, db_path)
 
     # Retrieve the updated task
-    updated_task = get_stored_task(task["id"], db_path)
+    with span("edit.db_read"):
+        updated_task = get_stored_task(task["id"], db_path)
     if not updated_task:
         print("Error retrieving updated task from database.")
         return
@@ -47,21 +53,31 @@ def edit_task(
 
     # Find corresponding Markdown file
     task_id = task["id"]
-    for filename in os.listdir(task_dir):
-        if f"-{task_id}-" in filename:
-            file_path = os.path.join(task_dir, filename)
-            break
-    else:
+    with span("edit.path_lookup"):
+        file_path = get_task_path(task_id, db_path, task_dir)
+    if not file_path or not os.path.exists(file_path):
         print("No corresponding Markdown file found.")
         return
 
     # Replace first line with the new task line
-    with open(file_path, "r", encoding="utf-8") as file:
-        lines = file.readlines()
+    with span("edit.file_rewrite"):
+        with open(file_path, "r", encoding="utf-8") as file:
+            lines = file.readlines()
 
-    lines[0] = new_task_line + "\n"
+        lines[0] = new_task_line + "\n"
 
-    with open(file_path, "w", encoding="utf-8") as file:
-        file.writelines(lines)
+        with open(file_path, "w", encoding="utf-8") as file:
+            file.writelines(lines)
+
+    # The file name carries the content and year, so keep it in step.
+    # Undated tasks keep the year they were filed under.
+    new_file_path = build_task_file_path(task, task_dir)
+    if not task["scheduled_date"]:
+        year = os.path.basename(file_path)[:4]
+        new_file_path = f"{task_dir}{year}{os.path.basename(new_file_path)[4:]}"
+    if new_file_path != file_path:
+        with span("edit.file_rename"):
+            os.replace(file_path, new_file_path)
+            record_task_path(task_id, new_file_path, db_path)
 
     print(f"Task {task_id} updated successfully.")
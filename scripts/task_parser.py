@@ -2,76 +2,122 @@
 Parse a string representing a task line and extract task details.
 This function searches for a task marker of the form:
     - [x or space] #task <content> [scheduled:: YYYY-MM-DD] [start:: YYYY-MM-DD]
-    [end:: YYYY-MM-DD] [priority:: <number>] [id:: <number>]
+    [due:: YYYY-MM-DD] [priority:: <number>] [id:: <number>]
+The trailing attributes may appear in any order.
 Parameters:
     line (str): A line of text representing a task to be parsed.
 Returns:
     dict or None: A dictionary with the following keys if the line matches:
         - "status" (str): "done" if marked with [x], otherwise "undone".
         - "content" (str): The main text of the task.
-        - "scheduled_date" (str or None): Scheduled date in 'YYYY-MM-DD' format.
-        - "start_date" (str or None): Start date in 'YYYY-MM-DD' format.
-        - "end_date" (str or None): End date in 'YYYY-MM-DD' format.
+        - "scheduled_date" (datetime or None): Scheduled date.
+        - "start_date" (datetime or None): Start date.
+        - "due_date" (datetime or None): Due date.
         - "priority" (int or None): Priority level extracted from the line.
         - "id" (int or None): Unique task identifier.
     Returns None if the line does not match the task pattern.
+Use parse_task_lines or parse_task_file to parse many lines lazily.
 """
 
 # pylint: disable= C0116, C0115
 import re
 from datetime import datetime
-from typing import Optional
-from scripts.func.model import TaskDetails
+from functools import lru_cache
+from typing import Iterable, Iterator, Optional
+from func.model import TaskDetails
 
-# TaskParser function to parse task lines
+# The grammar is compiled once at import time and shared by every call
+TASK_PATTERN = re.compile(r"- \[([ x])\]\s+#task\s")  # Status marker
+ATTRIBUTE_PATTERN = re.compile(
+    r"\[(?:(scheduled|start|due)::\s*(\d{4}-\d{2}-\d{2})|(priority|id)::\s*(\d+))\]"
+)
+
+_DATE_KEYS = {"scheduled": "scheduled_date", "start": "start_date", "due": "due_date"}
+
+
+@lru_cache(maxsize=4096)
+def parse_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse a YYYY-MM-DD string without going through strptime.
+    Task dates repeat a lot, so results are cached.
+    """
+    try:
+        return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
+    except ValueError:
+        return None
 
 
 def parse_task_line(line: str) -> Optional[TaskDetails]:
-    task_pattern = (
-        r"- \[([ x])\]\s+#task\s+(.*?)"  # Status and content
-        r"(?:\s+\[scheduled::\s*(\d{4}-\d{2}-\d{2})\])?"  # Scheduled date
-        r"(?:\s+\[start::\s*(\d{4}-\d{2}-\d{2})\])?"  # Start date
-        r"(?:\s+\[due::\s*(\d{4}-\d{2}-\d{2})\])?"  # Due date
-        r"(?:\s+\[priority::\s*(\d+)\])?"  # Priority
-        r"(?:\s+\[id::\s*(\d+)\])?"  # ID
-        r"\s*$"  # End of line to ensure clean matching
+    match = TASK_PATTERN.search(line)
+    if not match:
+        return None
+
+    task = TaskDetails(
+        status="done" if match.group(1) == "x" else "undone",
+        content="",
+        scheduled_date=None,
+        start_date=None,
+        due_date=None,
+        priority=None,
+        id=None,
     )
 
-    match = re.search(task_pattern, line)
-    print(match)  # Debugging the match object
-
-    if match:
-        scheduled_str = match.group(3)
-        start_str = match.group(4)
-        due_str = match.group(5)
-
-        try:
-            scheduled_date = (
-                datetime.strptime(scheduled_str, "%Y-%m-%d") if scheduled_str else None
-            )
-        except ValueError:
-            scheduled_date = None
-
-        try:
-            start_date = datetime.strptime(start_str, "%Y-%m-%d") if start_str else None
-        except ValueError:
-            start_date = None
-
-        try:
-            due_date = datetime.strptime(due_str, "%Y-%m-%d") if due_str else None
-        except ValueError:
-            due_date = None
-
-        return {
-            "status": "done" if match.group(1) == "x" else "undone",
-            "content": match.group(2),
-            "scheduled_date": scheduled_date,
-            "start_date": start_date,
-            "due_date": due_date,
-            "priority": int(match.group(6)) if match.group(6) else None,
-            "id": int(match.group(7)) if match.group(7) else None,
-        }
-    return None
+    # Peel attributes off the end of the line, so they may come in any order.
+    # The first attribute seen from the right is the last one written, and
+    # a repeated attribute keeps that value.
+    rest = line[match.end() :].rstrip()
+    seen = set()
+    while rest.endswith("]"):
+        start = rest.rfind("[")
+        if start < 1 or not rest[start - 1].isspace():
+            break
+        attribute = ATTRIBUTE_PATTERN.fullmatch(rest, start)
+        if not attribute:
+            break
+        date_key, date_value, int_key, int_value = attribute.groups()
+        if date_key:
+            key = _DATE_KEYS[date_key]
+            if key not in seen:
+                task[key] = parse_date(date_value)
+        else:
+            key = int_key
+            if key not in seen:
+                task[key] = int(int_value)
+        seen.add(key)
+        rest = rest[:start].rstrip()
+
+    task["content"] = rest.lstrip()
+    return task
+
+
+def parse_task_lines(lines: Iterable[str]) -> Iterator[TaskDetails]:
+    """
+    Lazily parse task lines, skipping lines that are not tasks.
+
+    Parameters:
+        lines (Iterable[str]): Lines of text, with or without trailing newlines.
+
+    Returns:
+        Iterator[TaskDetails]: The parsed tasks, in input order.
+    """
+    for line in lines:
+        task = parse_task_line(line.rstrip("\n"))
+        if task:
+            yield task
+
+
+def parse_task_file(file_path: str) -> Iterator[TaskDetails]:
+    """
+    Lazily parse every task line in a Markdown file.
+
+    Parameters:
+        file_path (str): The path to the Markdown file.
+
+    Returns:
+        Iterator[TaskDetails]: The parsed tasks, in file order.
+    """
+    with open(file_path, "r", encoding="utf-8") as file:
+        yield from parse_task_lines(file)
 
 
 # Example usage
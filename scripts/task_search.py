@@ -0,0 +1,64 @@
+"""
+Full-text search over task content and task file bodies.
+Queries run against the 'tasks_fts' FTS5 table created by init_db, which
+triggers keep in step with the tasks table and the file sync fills with
+file bodies, so no file is opened at query time. Results are ranked with
+BM25, weighting matches in the task line above matches in the body.
+Example:
+    for task_id, status, content, snippet, score in search_tasks("report"):
+        print(task_id, snippet)
+"""
+
+# pylint: disable=C0116
+from typing import List, Tuple
+from func.db import DB_PATH, get_readonly_connection
+
+# BM25 column weights for (content, body)
+CONTENT_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+
+
+def to_match_query(text: str) -> str:
+    """
+    Quote every word of free text so FTS5 operators and punctuation in it
+    are matched literally. All words must match.
+    """
+    return " ".join('"' + word.replace('"', '""') + '"' for word in text.split())
+
+
+def search_tasks(
+    query: str, limit: int = 20, raw: bool = False, db_path: str = DB_PATH
+) -> List[Tuple[int, str, str, str, float]]:
+    """
+    Find tasks whose content or file body matches the query.
+
+    Parameters:
+        query (str): Words to look for, or an FTS5 query when raw is True.
+        limit (int): Maximum number of results.
+        raw (bool): Pass the query to FTS5 unchanged (AND/OR/NEAR, prefix*).
+        db_path (str): The path to the database file.
+
+    Returns:
+        List[Tuple[int, str, str, str, float]]: (id, status, content, snippet,
+        score) rows, best match first.
+    """
+    match = query if raw else to_match_query(query)
+    if not match:
+        return []
+    return (
+        get_readonly_connection(db_path)
+        .execute(
+            f"""
+            SELECT t.id, t.status, t.content,
+                   snippet(tasks_fts, -1, '[', ']', '...', 12),
+                   bm25(tasks_fts, {CONTENT_WEIGHT}, {BODY_WEIGHT}) AS score
+            FROM tasks_fts
+            JOIN tasks t ON t.id = tasks_fts.rowid
+            WHERE tasks_fts MATCH ?
+            ORDER BY score
+            LIMIT ?
+            """,
+            (match, limit),
+        )
+        .fetchall()
+    )
@@ -0,0 +1,346 @@
+"""
+Stat-based incremental sync between the tasks/ directory and the database.
+The (mtime_ns, size, inode, content digest) of every task file is stored in
+the 'file_state' table. Each run stats the tasks/ tree and only opens files
+whose metadata changed; of those, only files whose digest changed are
+parsed and compared with the stored task hash. Git is used only when asked
+for, as a fallback source of candidate files.
+Example:
+    stats = sync_tasks()
+    print(stats["scanned"], stats["skipped"], stats["reparsed"])
+"""
+
+# pylint: disable=C0116
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Optional, Tuple, TypedDict
+from check_note_change import find_changed_tasks_in
+from func.db import DB_PATH, MAX_SQL_VARIABLES, get_cache, get_connection, transaction
+from func.model import TaskDetails, generate_task_hash
+from func.profiling import count, span
+from func.task_paths import record_task_paths
+from task_parser import parse_task_line
+from task_update_db import update_task_to_db
+
+# (mtime_ns, size, inode, digest)
+FileState = Tuple[int, int, int, str]
+
+# (path, digest, task, task hash, body) as produced by read_task_files
+FileReading = Tuple[str, str, Optional[TaskDetails], Optional[str], str]
+
+# Files handed to a worker process at a time
+SCAN_CHUNK_SIZE = 512
+
+# Changed tasks written per transaction
+WRITE_BATCH_SIZE = 5000
+
+
+class SyncStats(TypedDict):
+    scanned: int
+    skipped: int
+    reparsed: int
+    updated: int
+    removed: int
+    seconds: float
+
+
+class ChangeSet(TypedDict):
+    tasks: List[TaskDetails]
+    paths: List[Tuple[int, str]]
+    bodies: List[Tuple[str, int]]
+    states: Dict[str, FileState]
+    removed: List[str]
+    stats: SyncStats
+
+
+def scan_task_files(task_dir: str = "tasks/") -> Dict[str, os.stat_result]:
+    """
+    Stat every Markdown file below task_dir without opening any of them.
+
+    Parameters:
+        task_dir (str): The directory where task files are stored.
+
+    Returns:
+        Dict[str, os.stat_result]: The stat result of each file, keyed by path.
+    """
+    found = {}
+    pending = [task_dir.rstrip("/") or "."]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    found[entry.path] = entry.stat()
+    return found
+
+
+def read_task_file(file_path: str) -> Tuple[str, Optional[TaskDetails], str]:
+    """
+    Read a task file once, returning its content digest, parsed task line
+    and the body text below that line.
+
+    Parameters:
+        file_path (str): The path of the task file.
+
+    Returns:
+        Tuple[str, Optional[TaskDetails], str]: The digest of the file, the
+        task on its first line (None if it is not a task) and the body.
+    """
+    with open(file_path, "rb") as file:
+        data = file.read()
+    first_line, _, body = data.decode("utf-8", errors="replace").partition("\n")
+    return (
+        blake2b(data, digest_size=16).hexdigest(),
+        parse_task_line(first_line.strip()),
+        body,
+    )
+
+
+def read_task_files(file_paths: List[str]) -> List[FileReading]:
+    """
+    Read, parse and hash a chunk of task files. Runs in pool workers.
+
+    Parameters:
+        file_paths (List[str]): The paths of the task files.
+
+    Returns:
+        List[FileReading]: One (path, digest, task, task hash, body) entry per file.
+    """
+    readings = []
+    for file_path in file_paths:
+        try:
+            digest, task, body = read_task_file(file_path)
+        except FileNotFoundError:
+            # Deleted since it was stat-ed; the next run drops its state
+            continue
+        readings.append(
+            (file_path, digest, task, generate_task_hash(task) if task else None, body)
+        )
+    return readings
+
+
+def _read_all(file_paths: List[str], jobs: int) -> List[FileReading]:
+    if jobs <= 1 or len(file_paths) <= SCAN_CHUNK_SIZE:
+        return read_task_files(file_paths)
+    chunks = [
+        file_paths[start : start + SCAN_CHUNK_SIZE]
+        for start in range(0, len(file_paths), SCAN_CHUNK_SIZE)
+    ]
+    readings: List[FileReading] = []
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # map keeps chunk order, so results match the serial scan exactly
+        for chunk_readings in executor.map(read_task_files, chunks):
+            readings.extend(chunk_readings)
+    return readings
+
+
+def load_file_states(
+    db_path: str = DB_PATH, paths: Optional[List[str]] = None
+) -> Dict[str, FileState]:
+    # A full load stays cached for the next sync of a long-running process
+    cache = get_cache(db_path)
+    cached = cache.get("file_states")
+    if cached is not None:
+        if paths is None:
+            return cached
+        return {path: cached[path] for path in paths if path in cached}
+
+    conn = get_connection(db_path)
+    query = "SELECT path, mtime_ns, size, inode, digest FROM file_state"
+    if paths is None:
+        cache["file_states"] = {row[0]: row[1:] for row in conn.execute(query)}
+        return cache["file_states"]
+
+    states = {}
+    for start in range(0, len(paths), MAX_SQL_VARIABLES):
+        chunk = paths[start : start + MAX_SQL_VARIABLES]
+        placeholders = ", ".join("?" * len(chunk))
+        for row in conn.execute(f"{query} WHERE path IN ({placeholders})", chunk):
+            states[row[0]] = row[1:]
+    return states
+
+
+def _stat_paths(paths: List[str]) -> Dict[str, os.stat_result]:
+    found = {}
+    for file_path in paths:
+        try:
+            found[file_path] = os.stat(file_path)
+        except FileNotFoundError:
+            pass
+    return found
+
+
+def _git_candidates(task_dir: str) -> Dict[str, os.stat_result]:
+    # pylint: disable=import-outside-toplevel
+    from git_file_change import get_repo_file_changes
+
+    prefix = task_dir.rstrip("/") + "/"
+    changes = get_repo_file_changes()
+    candidates = {}
+    for file_path in changes["changed"] + changes["new"]:
+        if file_path.startswith(prefix) and os.path.isfile(file_path):
+            candidates[file_path] = os.stat(file_path)
+    return candidates
+
+
+def scan_changes(
+    task_dir: str = "tasks/",
+    db_path: str = DB_PATH,
+    use_git: bool = False,
+    jobs: int = 1,
+    paths: Optional[Iterable[str]] = None,
+) -> ChangeSet:
+    """
+    Find the tasks whose files changed since the last sync.
+
+    Parameters:
+        task_dir (str): The directory where task files are stored.
+        db_path (str): The path to the database file.
+        use_git (bool): Take candidate files from Git status instead of
+            stat-ing the whole tree. Deleted files are not detected then.
+        jobs (int): Worker processes for reading changed files; 0 uses every core.
+        paths (Iterable[str], optional): Only look at these Markdown files,
+            e.g. the ones a file watcher reported. Missing ones count as removed.
+
+    Returns:
+        ChangeSet: Changed tasks, the file states and paths to store, the
+        paths that disappeared, and per-run counters.
+    """
+    started = time.perf_counter()
+    with span("sync.load_state"):
+        if paths is not None:
+            paths = sorted({path for path in paths if path.endswith(".md")})
+            stored = load_file_states(db_path, paths)
+        else:
+            stored = load_file_states(db_path)
+    with span("sync.git_status" if use_git and paths is None else "sync.stat"):
+        if paths is not None:
+            on_disk = _stat_paths(paths)
+        else:
+            on_disk = _git_candidates(task_dir) if use_git else scan_task_files(task_dir)
+
+    change_set = ChangeSet(
+        tasks=[],
+        paths=[],
+        bodies=[],
+        states={},
+        removed=[] if use_git else [path for path in stored if path not in on_disk],
+        stats=SyncStats(
+            scanned=len(on_disk), skipped=0, reparsed=0, updated=0, removed=0, seconds=0.0
+        ),
+    )
+    stats = change_set["stats"]
+    stats["removed"] = len(change_set["removed"])
+    candidates = []
+
+    for file_path, stat in on_disk.items():
+        previous = stored.get(file_path)
+        if previous and previous[:3] == (stat.st_mtime_ns, stat.st_size, stat.st_ino):
+            stats["skipped"] += 1
+        else:
+            candidates.append(file_path)
+
+    with span("sync.read_parse_hash"):
+        readings = _read_all(candidates, jobs or os.cpu_count() or 1)
+
+    parsed = []
+    task_hashes = []
+    for file_path, digest, task, task_hash, body in readings:
+        stat = on_disk[file_path]
+        change_set["states"][file_path] = (
+            stat.st_mtime_ns,
+            stat.st_size,
+            stat.st_ino,
+            digest,
+        )
+        previous = stored.get(file_path)
+        if previous and previous[3] == digest:
+            # Touched or copied, but the bytes are the same
+            stats["skipped"] += 1
+            continue
+
+        stats["reparsed"] += 1
+        if not task or task["id"] is None:
+            continue
+        change_set["paths"].append((task["id"], file_path))
+        change_set["bodies"].append((body, task["id"]))
+        parsed.append(task)
+        task_hashes.append(task_hash)
+
+    # One batched hash lookup for every reparsed file
+    with span("sync.compare_hashes"):
+        change_set["tasks"] = find_changed_tasks_in(parsed, db_path, task_hashes)
+    count("sync.files_scanned", stats["scanned"])
+    count("sync.files_skipped", stats["skipped"])
+    count("sync.files_reparsed", stats["reparsed"])
+    stats["seconds"] = time.perf_counter() - started
+    return change_set
+
+
+def apply_changes(change_set: ChangeSet, db_path: str = DB_PATH) -> SyncStats:
+    """
+    Write changed tasks in batched transactions, then the new file states
+    and the file bodies of the full-text index.
+
+    Parameters:
+        change_set (ChangeSet): The result of scan_changes.
+        db_path (str): The path to the database file.
+
+    Returns:
+        SyncStats: The counters of the change set, with 'updated' filled in.
+    """
+    started = time.perf_counter()
+    stats = change_set["stats"]
+    tasks = change_set["tasks"]
+    for start in range(0, len(tasks), WRITE_BATCH_SIZE):
+        with span("sync.db_update"), transaction(db_path):
+            for task in tasks[start : start + WRITE_BATCH_SIZE]:
+                if update_task_to_db(task, db_path):
+                    stats["updated"] += 1
+
+    with span("sync.db_state"), transaction(db_path) as conn:
+        record_task_paths(change_set["paths"], db_path)
+        conn.executemany(
+            "UPDATE tasks_fts SET body = ? WHERE rowid = ?", change_set["bodies"]
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO file_state (path, mtime_ns, size, inode, digest) VALUES (?, ?, ?, ?, ?)",
+            [(path, *state) for path, state in change_set["states"].items()],
+        )
+        conn.executemany(
+            "DELETE FROM file_state WHERE path = ?",
+            [(path,) for path in change_set["removed"]],
+        )
+        cached = get_cache(db_path).get("file_states")
+        if cached is not None:
+            cached.update(change_set["states"])
+            for path in change_set["removed"]:
+                cached.pop(path, None)
+    count("sync.tasks_updated", stats["updated"])
+    stats["seconds"] += time.perf_counter() - started
+    return stats
+
+
+def sync_tasks(
+    task_dir: str = "tasks/",
+    db_path: str = DB_PATH,
+    use_git: bool = False,
+    jobs: int = 1,
+) -> SyncStats:
+    """
+    Bring the database up to date with the task files that changed.
+
+    Parameters:
+        task_dir (str): The directory where task files are stored.
+        db_path (str): The path to the database file.
+        use_git (bool): Use Git status as the source of candidate files.
+        jobs (int): Worker processes for reading changed files; 0 uses every core.
+
+    Returns:
+        SyncStats: Files scanned, skipped and reparsed, tasks updated and
+        file states removed, plus the elapsed time.
+    """
+    return apply_changes(scan_changes(task_dir, db_path, use_git, jobs), db_path)
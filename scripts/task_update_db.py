@@ -21,14 +21,11 @@ Returns:
 
 # pylint: disable=C0116
 # mypy: ignore-errors
-import sqlite3
-from scripts.func.model import TaskDetails, convert_date, generate_task_hash
+from func.db import DB_PATH, transaction
+from func.model import HASH_VERSION, TaskDetails, convert_date, generate_task_hash
 
 
-def update_task_to_db(task: TaskDetails, db_path: str = "db/tasks.db") -> bool:
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-
+def update_task_to_db(task: TaskDetails, db_path: str = DB_PATH) -> bool:
     # Prepare fields for update (including None values explicitly)
     set_clauses = [
         "content = ?",
@@ -38,6 +35,7 @@ def update_task_to_db(task: TaskDetails, db_path: str = "db/tasks.db") -> bool:
         "due_date = ?",
         "priority = ?",
         "hash = ?",
+        "hash_version = ?",
         "modified_date = datetime('now')",
     ]
 
@@ -47,8 +45,9 @@ def update_task_to_db(task: TaskDetails, db_path: str = "db/tasks.db") -> bool:
         convert_date(task["scheduled_date"]) if task["scheduled_date"] else None,
         convert_date(task["start_date"]) if task["start_date"] else None,
         convert_date(task["due_date"]) if task["due_date"] else None,
-        str(task["priority"]) if task["priority"] is not None else None,
+        int(task["priority"]) if task["priority"] is not None else None,
         generate_task_hash(task),  # Always update hash
+        HASH_VERSION,
     ]
 
     # Append task ID for WHERE clause
@@ -61,9 +60,8 @@ def update_task_to_db(task: TaskDetails, db_path: str = "db/tasks.db") -> bool:
         WHERE id = ?
     """
 
-    cursor.execute(sql, values)
-    success = cursor.rowcount > 0  # Check if any row was updated
-    conn.commit()
-    conn.close()
+    with transaction(db_path) as conn:
+        cursor = conn.execute(sql, values)
+        success = cursor.rowcount > 0  # Check if any row was updated
 
     return success
@@ -0,0 +1,229 @@
+"""
+Watch the tasks/ and notes/ directories and keep the database in sync.
+On Linux the kernel's inotify API is used through ctypes, so the process
+sleeps until something changes. Elsewhere, or with poll=True, the trees
+are stat-ed every few seconds instead. Events are debounced: a burst of
+saves is collected until the directories have been quiet for a moment,
+and then only the touched files are re-parsed and written to the database.
+Example:
+    watch(debounce=0.2)
+"""
+
+# pylint: disable=C0116
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from func.db import DB_PATH
+from task_sync import SyncStats, apply_changes, scan_changes, scan_task_files
+
+WATCH_DIRS = ("tasks", "notes")
+
+# inotify constants from <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+)
+EVENT_HEADER = struct.Struct("iIII")
+
+
+class Inotify:
+    """Minimal recursive inotify watcher built on libc through ctypes."""
+
+    def __init__(self, directories: Iterable[str]):
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self._libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: Dict[int, str] = {}
+        for directory in directories:
+            self.add_tree(directory)
+
+    def add_tree(self, directory: str) -> None:
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            watch = self._libc.inotify_add_watch(
+                self.fd, os.fsencode(current), WATCH_MASK
+            )
+            if watch < 0:
+                continue
+            self._dirs[watch] = current
+            with os.scandir(current) as entries:
+                pending.extend(
+                    entry.path for entry in entries if entry.is_dir(follow_symlinks=False)
+                )
+
+    def read_events(self, timeout: Optional[float]) -> Optional[Set[str]]:
+        """
+        Wait for events and return the touched paths.
+        Returns None when the kernel queue overflowed and events were lost.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+
+        touched: Set[str] = set()
+        offset = 0
+        while offset < len(data):
+            watch, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset : offset + length].rstrip(b"\0").decode(errors="replace")
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                return None
+            if mask & IN_IGNORED:
+                self._dirs.pop(watch, None)
+                continue
+            directory = self._dirs.get(watch)
+            if directory is None or not name:
+                continue
+            path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    self.add_tree(path)
+                    touched.update(scan_task_files(path))
+                continue
+            touched.add(path)
+        return touched
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+def _snapshot(directories: Iterable[str]) -> Dict[str, Tuple[int, int, int]]:
+    snapshot = {}
+    for directory in directories:
+        for path, stat in scan_task_files(directory).items():
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+    return snapshot
+
+
+def sync_paths(paths: Iterable[str], db_path: str = DB_PATH) -> SyncStats:
+    """
+    Re-parse only the given files and write their changes to the database.
+
+    Parameters:
+        paths (Iterable[str]): Touched files; deleted ones drop their file state.
+        db_path (str): The path to the database file.
+
+    Returns:
+        SyncStats: The counters of this targeted sync.
+    """
+    return apply_changes(scan_changes(db_path=db_path, paths=paths), db_path)
+
+
+def _report(stats: SyncStats) -> None:
+    print(
+        f"[{time.strftime('%H:%M:%S')}] {stats['scanned']} files touched: "
+        f"{stats['reparsed']} reparsed, {stats['updated']} tasks updated, "
+        f"{stats['removed']} removed ({stats['seconds'] * 1000:.0f} ms)."
+    )
+
+
+def watch(
+    directories: Iterable[str] = WATCH_DIRS,
+    debounce: float = 0.2,
+    max_delay: float = 2.0,
+    poll: bool = False,
+    interval: float = 2.0,
+    db_path: str = DB_PATH,
+    on_sync: Callable[[SyncStats], None] = _report,
+) -> None:
+    """
+    Watch task and note directories until interrupted, syncing each burst.
+
+    Parameters:
+        directories (Iterable[str]): Directories to watch.
+        debounce (float): Seconds of quiet that end a burst of events.
+        max_delay (float): Longest time a burst may be held back, in seconds.
+        poll (bool): Stat the trees every interval seconds instead of using inotify.
+        interval (float): Polling interval in seconds.
+        db_path (str): The path to the database file.
+        on_sync (Callable): Called with the stats of every sync.
+    """
+    directories = [directory for directory in directories if os.path.isdir(directory)]
+    notifier = None
+    if not poll:
+        try:
+            notifier = Inotify(directories)
+        except OSError as exc:
+            print(f"inotify unavailable ({exc}); falling back to polling.")
+
+    print(
+        f"Watching {', '.join(directories)} "
+        f"({'inotify' if notifier else f'polling every {interval}s'}). Press Ctrl+C to stop."
+    )
+    snapshot = None if notifier else _snapshot(directories)
+    try:
+        while True:
+            if notifier:
+                pending = notifier.read_events(None)
+                burst_started = time.monotonic()
+                while pending is not None:
+                    remaining = max_delay - (time.monotonic() - burst_started)
+                    if remaining <= 0:
+                        break
+                    more = notifier.read_events(min(debounce, remaining))
+                    if more is None:
+                        pending = None
+                    elif not more:
+                        break
+                    else:
+                        pending |= more
+                if pending is None:
+                    # Events were dropped: fall back to one full stat-based sync
+                    on_sync(apply_changes(scan_changes(db_path=db_path)))
+                    continue
+                touched: List[str] = sorted(pending)
+            else:
+                time.sleep(interval)
+                current = _snapshot(directories)
+                touched = sorted(
+                    path
+                    for path in current.keys() | snapshot.keys()
+                    if current.get(path) != snapshot.get(path)
+                )
+                snapshot = current
+
+            if touched:
+                stats = sync_paths(touched, db_path)
+                if stats["scanned"] or stats["removed"]:
+                    on_sync(stats)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+    finally:
+        if notifier:
+            notifier.close()